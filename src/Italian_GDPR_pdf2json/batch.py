@@ -0,0 +1,213 @@
+"""
+Batch ingestion of a directory of GDPR PDFs, e.g. the national implementations
+of the member states, into the gdpr-<locale>.json datasets read by
+to-turtle/main.py.
+
+The locale of a PDF is its file name without the "gdpr-" prefix
+(gdpr-de.pdf -> de, gdpr-eu-pt.pdf -> eu-pt, gdpr-de-en.pdf -> de-en) and its
+language, which selects the heading patterns of to_json.LANGUAGES, the last
+part of the locale. Each PDF goes through the stages of pipeline.py in a worker
+process of its own; a PDF that fails is reported and does not stop the others.
+
+Before a dataset is written, its triples are built with the rule tables of
+to-turtle (see check_dataset), so a file to-turtle cannot read is never
+written. Existing datasets are only overwritten with --force.
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from pdf_text import DEFAULT_CACHE_DIR, extract_text
+from pipeline import clean, strip_parentheses, structure, to_dataset, write_json
+from to_json import LANGUAGES
+
+TO_TURTLE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                              os.pardir, 'scripts', 'to-turtle'))
+
+PDF_NAME_PATTERN = re.compile(r'gdpr-([a-z]{2}(?:-[a-z]{2})*)\.pdf', re.IGNORECASE)
+
+Job = namedtuple('Job', ['pdf_path', 'locale', 'language', 'json_path'])
+# timings: seconds spent per stage ('extract', 'structure', 'check', 'write') and
+# in total; triples: built by check_dataset, None when not checked
+Result = namedtuple('Result', ['job', 'timings', 'chapters', 'articles', 'triples', 'error'])
+
+
+def find_jobs(pdf_dir, output_dir, language=None):
+    """
+    :param pdf_dir: Directory of gdpr-<locale>.pdf files
+    :param output_dir: Directory the gdpr-<locale>.json files are written to
+    :param language: Language of all the PDFs, instead of the one of their locale
+    :return: (jobs, names of the PDFs not named after a locale)
+    """
+    jobs, ignored = [], []
+    for name in sorted(os.listdir(pdf_dir)):
+        if not name.lower().endswith('.pdf'):
+            continue
+        match = PDF_NAME_PATTERN.fullmatch(name)
+        if match is None:
+            ignored.append(name)
+            continue
+        locale = match.group(1).lower()
+        jobs.append(Job(pdf_path=os.path.join(pdf_dir, name),
+                        locale=locale,
+                        language=language or locale.split('-')[-1],
+                        json_path=os.path.join(output_dir, f"gdpr-{locale}.json")))
+    return jobs, ignored
+
+
+def count_articles(document):
+    return sum(1 for chapter in document.values() for node in chapter['content'].values()
+               if node['classType'] == 'ARTICLE')
+
+
+def check_dataset(document, locale):
+    """
+    Build the triples of a dataset the way to-turtle/main.py builds
+    gdpr-<locale>.json: the EU layer for an eu-<language> locale, the national
+    abstract and concrete layers otherwise.
+
+    :raises ValueError: for a node to-turtle cannot read
+    :return: Number of triples
+    """
+    if TO_TURTLE_DIR not in sys.path:
+        sys.path.insert(0, TO_TURTLE_DIR)
+    import rdflib
+    from main import CUSTOM_NAMESPACES
+    from handlers.walker import WalkContext, walk
+
+    name = locale.replace('-', '_')
+    layers = ['eu'] if name.startswith('eu_') else ['national_abstract', 'national']
+    graph = rdflib.Graph()
+    for layer in layers:
+        ctx = WalkContext(graph, layer, CUSTOM_NAMESPACES, name, [name])
+        for key, node in document.items():
+            walk(ctx, key, node)
+    return len(graph)
+
+
+def ingest(job, cache_dir=DEFAULT_CACHE_DIR, overwrite=False, check=True):
+    """
+    Convert one PDF to its JSON dataset. Runs in a worker process, so errors
+    are returned in the Result rather than raised.
+
+    :param overwrite: Replace the JSON file of the job if it exists
+    :param check: Build the dataset with check_dataset before writing it
+    :return: Result
+    """
+    timings = {}
+    start = stage_start = time.perf_counter()
+
+    def lap(stage):
+        nonlocal stage_start
+        now = time.perf_counter()
+        timings[stage] = now - stage_start
+        stage_start = now
+
+    try:
+        if not overwrite and os.path.exists(job.json_path):
+            raise FileExistsError(f"{job.json_path} already exists (--force overwrites it)")
+        if job.language not in LANGUAGES:
+            raise ValueError(f"no heading patterns for language '{job.language}'")
+        text = extract_text(job.pdf_path, cache_dir=cache_dir)
+        lap('extract')
+        [(_, document)] = to_dataset(structure(strip_parentheses(clean([(job.pdf_path, text)])), job.language))
+        lap('structure')
+        if not document:
+            # Most likely the wrong language; do not overwrite the dataset
+            raise ValueError(f"no chapter headings found for language '{job.language}'")
+        triples = None
+        if check:
+            triples = check_dataset(document, job.locale)
+            lap('check')
+        list(write_json([(job.pdf_path, document)], lambda source: job.json_path))
+        lap('write')
+        error, chapters, articles = None, len(document), count_articles(document)
+    except Exception as e:
+        error, chapters, articles, triples = f"{type(e).__name__}: {e}", None, None, None
+    timings['total'] = time.perf_counter() - start
+    return Result(job, timings, chapters, articles, triples, error)
+
+
+def run_batch(jobs, workers=None, cache_dir=DEFAULT_CACHE_DIR, report=None, overwrite=False, check=True):
+    """
+    Ingest the PDFs of the jobs concurrently, one worker process per PDF.
+
+    :param workers: Number of worker processes (default: CPU count)
+    :param report: Called with each Result as soon as its PDF is done
+    :param overwrite, check: See ingest
+    :return: List of Result, in the order of the jobs
+    """
+    if not jobs:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(ingest, job, cache_dir, overwrite, check): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died, e.g. BrokenProcessPool
+                result = Result(job, {}, None, None, None, f"{type(e).__name__}: {e}")
+            results[job] = result
+            if report:
+                report(result)
+    return [results[job] for job in jobs]
+
+
+def format_result(result):
+    name = os.path.basename(result.job.pdf_path)
+    timings = ', '.join(f"{stage} {seconds:.2f}s" for stage, seconds in result.timings.items())
+    if result.error:
+        return f"FAIL {name} ({result.job.language}): {result.error} [{timings}]"
+    triples = f", {result.triples} triples" if result.triples is not None else ""
+    return (f"  ok {name} ({result.job.language}) -> {result.job.json_path}: "
+            f"{result.chapters} chapters, {result.articles} articles{triples} [{timings}]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a directory of gdpr-<locale>.pdf files to the datasets "
+                                                 "JSON schema, in parallel")
+    parser.add_argument('pdf_dir', help="directory of gdpr-<locale>.pdf files")
+    parser.add_argument('-o', '--output-dir', required=True,
+                        help="directory the gdpr-<locale>.json files are written to, e.g. src/datasets, "
+                             "read by to-turtle/main.py")
+    parser.add_argument('--force', action='store_true',
+                        help="overwrite existing gdpr-<locale>.json files")
+    parser.add_argument('--no-check', action='store_true',
+                        help="write the datasets without building them with the to-turtle rules first")
+    parser.add_argument('--language', default=None, choices=sorted(LANGUAGES),
+                        help="language of the headings of all the PDFs (default: the last part of their locale)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help="where the extracted text of each page is cached, by PDF hash")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always extract the text from the PDFs")
+    args = parser.parse_args()
+
+    jobs, ignored = find_jobs(args.pdf_dir, args.output_dir, args.language)
+    for name in ignored:
+        print(f"skip {name}: not named gdpr-<locale>.pdf")
+
+    start = time.perf_counter()
+    results = run_batch(jobs, args.workers, None if args.no_cache else args.cache_dir,
+                        lambda result: print(format_result(result), flush=True),
+                        overwrite=args.force, check=not args.no_check)
+    failures = [result for result in results if result.error]
+    print(f"{len(results) - len(failures)}/{len(results)} PDFs converted in {time.perf_counter() - start:.2f}s")
+    if failures:
+        print("Failed:")
+        for result in failures:
+            print(f"  {result.job.pdf_path}: {result.error}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,11 @@
-from pdfminer.high_level import extract_text
+import argparse
 import re
 from collections import defaultdict
 import json
 import os
 
+from pdf_text import DEFAULT_CACHE_DIR, extract_text
+
 
 
 
@@ -267,22 +269,33 @@ def remove_text_within_parentheses(text):
 
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Convert the Italian GDPR PDF to JSON")
+    parser.add_argument('pdf_path', nargs='?', default='it_gdpr.pdf', help="PDF to convert")
+    parser.add_argument('--parallel', action='store_true',
+                        help="extract page ranges in worker processes")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help="where the extracted text of each page is cached, by PDF hash")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always extract the text from the PDF")
+    args = parser.parse_args()
 
-pdf_path = 'it_gdpr.pdf'
-raw_text = extract_text(pdf_path)
-processed_text = process_pdf_text(raw_text)
-processed_text = remove_text_within_parentheses(processed_text)
+    raw_text = extract_text(args.pdf_path, args.parallel, args.workers,
+                            None if args.no_cache else args.cache_dir)
+    processed_text = process_pdf_text(raw_text)
+    processed_text = remove_text_within_parentheses(processed_text)
 
-with open('gdpr_formatted.txt', 'w', encoding='utf-8') as f:
+    with open('gdpr_formatted.txt', 'w', encoding='utf-8') as f:
         f.write(processed_text)
 
+    gdpr_json = parse_gdpr_text()
 
-with open('gdpr_formatted.txt', 'r', encoding='utf-8') as f:
-        formatted_text = f.read()
-    
+    # Save to JSON file
+    with open('gdpr_structured.json', 'w', encoding='utf-8') as f:
+        json.dump(gdpr_json, f, ensure_ascii=False, indent=2)
 
-gdpr_json = parse_gdpr_text()
 
-# Save to JSON file
-with open('gdpr_structured.json', 'w', encoding='utf-8') as f:
-    json.dump(gdpr_json, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+import hashlib
+import io
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pdfminer
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pdf-cache")
+
+# Page ranges handed out per worker, so a slow range does not hold up the others
+SHARDS_PER_WORKER = 4
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def page_count(pdf_path):
+    with open(pdf_path, 'rb') as fp:
+        return sum(1 for _ in PDFPage.create_pages(PDFDocument(PDFParser(fp))))
+
+
+def extract_page_texts(pdf_path, page_numbers=None):
+    """
+    Extract the text of each page, the way pdfminer.high_level.extract_text
+    does for the whole document (which is the concatenation of these texts).
+
+    :param pdf_path: Path of the PDF file
+    :param page_numbers: Zero-based page numbers to extract, all pages if None
+    :return: List of page texts, in page order
+    """
+    texts = []
+    with open(pdf_path, 'rb') as fp, io.StringIO() as output:
+        rsrcmgr = PDFResourceManager(caching=True)
+        device = TextConverter(rsrcmgr, output, codec='utf-8', laparams=LAParams())
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        for page in PDFPage.get_pages(fp, page_numbers, caching=True):
+            interpreter.process_page(page)
+            texts.append(output.getvalue())
+            output.seek(0)
+            output.truncate(0)
+    return texts
+
+
+def page_ranges(pages, shards):
+    """Split range(pages) into at most `shards` contiguous ranges."""
+    size = max(1, math.ceil(pages / max(1, shards)))
+    return [range(start, min(start + size, pages)) for start in range(0, pages, size)]
+
+
+def extract_pages_parallel(pdf_path, workers=None):
+    """
+    Extract the page texts with page ranges farmed out to a process pool,
+    reassembled in page order.
+
+    :param pdf_path: Path of the PDF file
+    :param workers: Number of worker processes (default: CPU count)
+    :return: List of page texts, in page order
+    """
+    workers = workers or os.cpu_count() or 1
+    ranges = page_ranges(page_count(pdf_path), workers * SHARDS_PER_WORKER)
+    texts = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map() yields the results in the order of the ranges
+        for shard in executor.map(extract_page_texts, [pdf_path] * len(ranges), ranges):
+            texts.extend(shard)
+    return texts
+
+
+def cache_key(sha256):
+    # Other pdfminer versions may lay the text out differently
+    return f"{sha256}:{pdfminer.__version__}"
+
+
+def load_cached_pages(cache_dir, sha256):
+    """Return the cached page texts of a PDF, or None if missing or stale."""
+    path = os.path.join(cache_dir, f"{sha256}.json")
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('key') != cache_key(sha256):
+        return None
+    return cached['pages']
+
+
+def store_cached_pages(cache_dir, sha256, pages):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{sha256}.json")
+    # Written to a temporary file first so an interrupted run never leaves a
+    # truncated cache entry behind, nor do two processes storing the same PDF
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'key': cache_key(sha256), 'pages': pages}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def extract_text(pdf_path, parallel=False, workers=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Extract the text of a PDF, identical to pdfminer.high_level.extract_text.
+
+    :param pdf_path: Path of the PDF file
+    :param parallel: Extract page ranges in a process pool
+    :param workers: Number of worker processes when parallel (default: CPU count)
+    :param cache_dir: Directory of the per-page text cache, keyed by the hash of
+        the PDF; re-runs on the same PDF skip extraction. None disables it
+    :return: Extracted text
+    """
+    sha256 = file_hash(pdf_path) if cache_dir else None
+    pages = load_cached_pages(cache_dir, sha256) if cache_dir else None
+    if pages is None:
+        if parallel:
+            pages = extract_pages_parallel(pdf_path, workers)
+        else:
+            pages = extract_page_texts(pdf_path)
+        if cache_dir:
+            store_cached_pages(cache_dir, sha256, pages)
+    return ''.join(pages)
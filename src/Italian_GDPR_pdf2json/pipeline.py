@@ -0,0 +1,138 @@
+"""
+In-memory pipeline from a national GDPR PDF to the JSON schema of
+src/datasets/gdpr-*.json, without the intermediate gdpr_formatted.txt and
+chapters/*.txt files of it_gdpr_to_json.py and to_json.py:
+
+    extract -> clean -> strip_parentheses -> structure -> to_dataset -> write_json
+
+structure gives the tree of to_json.parse_legal_document, which groups points
+under "points" and subpoints under "subpoints"; to_dataset lays it out as the
+datasets that to-turtle/main.py reads.
+
+Every stage is a generator of (source, value) pairs, one per PDF, so the
+stages can be composed freely and PDFs flow through them one at a time. dump()
+can be put between any two stages to inspect what flows through them.
+"""
+
+import argparse
+import json
+import os
+
+from it_gdpr_to_json import process_pdf_text, remove_text_within_parentheses
+from pdf_text import DEFAULT_CACHE_DIR, extract_text
+from to_json import DEFAULT_LANGUAGE, LANGUAGES, dataset_layout, parse_legal_document
+
+
+def extract(pdf_paths, parallel=False, workers=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    :param pdf_paths: Paths of the PDF files
+    :return: Generator of (pdf_path, raw text)
+    """
+    for pdf_path in pdf_paths:
+        yield pdf_path, extract_text(pdf_path, parallel, workers, cache_dir)
+
+
+def clean(items):
+    """Collapse whitespace, undo hyphenation and tidy punctuation."""
+    for source, text in items:
+        yield source, process_pdf_text(text)
+
+
+def strip_parentheses(items):
+    """Drop the parenthesised references, e.g. to the recitals ("(C51)")."""
+    for source, text in items:
+        yield source, remove_text_within_parentheses(text)
+
+
+def structure(items, language=DEFAULT_LANGUAGE):
+    """Build the chapter/article/point tree of each text, with the headings of `language`."""
+    for source, text in items:
+        yield source, parse_legal_document(text, language)
+
+
+def to_dataset(items):
+    """Lay out each tree of structure() as a gdpr-*.json dataset (see to_json.dataset_layout)."""
+    for source, document in items:
+        yield source, dataset_layout(document)
+
+
+def dump(items, debug_dir, stage):
+    """
+    Pass the items through unchanged, writing each value to
+    <debug_dir>/<PDF name>.<stage>.txt (or .json for documents).
+    """
+    os.makedirs(debug_dir, exist_ok=True)
+    for source, value in items:
+        name = os.path.splitext(os.path.basename(source))[0]
+        is_text = isinstance(value, str)
+        path = os.path.join(debug_dir, f"{name}.{stage}.{'txt' if is_text else 'json'}")
+        with open(path, 'w', encoding='utf-8') as f:
+            if is_text:
+                f.write(value)
+            else:
+                json.dump(value, f, ensure_ascii=False, indent=2)
+        yield source, value
+
+
+def write_json(items, output_path):
+    """
+    Write each document to output_path(source).
+
+    :return: Generator of (source, path written)
+    """
+    for source, document in items:
+        path = output_path(source)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+        yield source, path
+
+
+def run(pdf_paths, output_path, debug_dir=None, parallel=False, workers=None, cache_dir=DEFAULT_CACHE_DIR,
+        language=DEFAULT_LANGUAGE):
+    """
+    Convert PDFs to JSON documents in one process.
+
+    :param pdf_paths: Paths of the PDF files
+    :param output_path: Function of the PDF path returning the JSON path
+    :param debug_dir: If given, the output of every stage is also written there
+    :param language: Key of to_json.LANGUAGES the headings are written in
+    :return: List of (pdf_path, JSON path)
+    """
+    def tap(items, stage):
+        return dump(items, debug_dir, stage) if debug_dir else items
+
+    items = tap(extract(pdf_paths, parallel, workers, cache_dir), 'extracted')
+    items = tap(clean(items), 'cleaned')
+    items = tap(strip_parentheses(items), 'stripped')
+    items = tap(structure(items, language), 'structured')
+    items = to_dataset(items)
+    return list(write_json(items, output_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a national GDPR PDF to the datasets JSON schema")
+    parser.add_argument('pdf_path', nargs='?', default='it_gdpr.pdf', help="PDF to convert")
+    parser.add_argument('-o', '--output', default='gdpr-it.json', help="JSON file to write")
+    parser.add_argument('--language', default=DEFAULT_LANGUAGE, choices=sorted(LANGUAGES),
+                        help="language of the chapter/section/article headings")
+    parser.add_argument('--debug-dir', default=None,
+                        help="also write the output of every stage to this directory")
+    parser.add_argument('--parallel', action='store_true',
+                        help="extract page ranges in worker processes")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help="where the extracted text of each page is cached, by PDF hash")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always extract the text from the PDF")
+    args = parser.parse_args()
+
+    for pdf_path, json_path in run([args.pdf_path], lambda source: args.output, args.debug_dir,
+                                   args.parallel, args.workers,
+                                   None if args.no_cache else args.cache_dir, args.language):
+        print(f"{pdf_path} -> {json_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,68 +1,233 @@
+import heapq
 import re
 import json
 import uuid
+from collections import namedtuple
+from functools import lru_cache
+from operator import attrgetter
 
-def parse_legal_document(text):
+# Heading vocabulary of a language, as regex fragments: the chapter heading
+# with its numeral as group 1, the section heading, the article word, the
+# article number as group 1 and what ends an article title besides its first
+# point. Titles are sentence case in most languages, so a capitalised word
+# (other than "... dell'Unione") starts the article text.
+Language = namedtuple('Language', ['chapter', 'section', 'article', 'article_number', 'title_end'])
+
+LANGUAGES = {
+    'it': Language(r'CAPO\s+([IVXLCDM]+)', r'Sezione', 'Articolo', r' (\d+)',
+                   r'\s+[A-Z][a-z]+(?!\s*Unione)'),
+    # KAPITEL I in the regulation, Kapitel 1 in the national law. References
+    # ("Artikel 6 Absatz 1", "Artikel89 Absatz1", "Artikel 98 an die") are
+    # capitalised too, so a heading must be followed by a title word. Nouns are
+    # capitalised, so the text starts at an article, pronoun or conjunction.
+    'de': Language(r'(?:KAPITEL\s+(?=[IVXLCDM])|Kapitel\s+(?=\d))([IVXLCDM]+|\d+)', r'Abschnitt', 'Artikel',
+                   r'\s*(\d+)(?=\s*[A-ZÄÖÜ][a-zäöüß])'
+                   r'(?!\s*(?:Absatz|Absätze|Unterabsatz|Buchstabe|Satz|Nummer))',
+                   r'\s+(?:Diese[mnrs]?|De[mnrs]|Die|Das|Eine?|Es|Jede[mnrs]?|Im|In|Bei|Für|Falls'
+                   r'|Soweit|Sofern|Unbeschadet|Wer|Wird|Werden)\b'),
+    # Artigo 1.º, or 1.o as extracted from some PDFs; Secção in the regulation,
+    # SECÇÃO in the national law. The text may start at the article A/O/As/Os.
+    'pt': Language(r'CAPÍTULO\s+([IVXLCDM]+)', r'Secção|SECÇÃO', 'Artigo', r' (\d+)(?:\.\s*[ºo°])?',
+                   r'\s+(?:[A-Z][a-z]+|[AO]s?\b)(?!\s*União)'),
+    'es': Language(r'CAPÍTULO\s+([IVXLCDM]+)', r'Sección', 'Artículo', r' (\d+)',
+                   r'\s+[A-Z][a-z]+(?!\s*Unión)'),
+    'fr': Language(r'CHAPITRE\s+([IVXLCDM]+)', r'Section', 'Article', r' (\d+)',
+                   r'\s+[A-Z][a-z]+(?!\s*Union)'),
+    'en': Language(r'CHAPTER\s+([IVXLCDM]+)', r'Section', 'Article', r' (\d+)',
+                   r'\s+[A-Z][a-z]+(?!\s*Union)'),
+}
+DEFAULT_LANGUAGE = 'it'
+
+# Compiled patterns of a language (see language_patterns)
+Patterns = namedtuple('Patterns', ['heading_patterns', 'chapter_title', 'article'])
+# Searched within the text of an article and of a point respectively
+POINT_PATTERN = re.compile(r'(?<!\()\b(\d+)[\.\)]\s(.+?)(?=\d+[\.\)]\s|$)', re.DOTALL)
+SUBPOINT_PATTERN = re.compile(r'\b([a-z])\)\s*(.+?)(?=\b[a-z]\)|$)', re.DOTALL | re.MULTILINE)
+
+# Namespace of the node ids below, so they do not collide with other uuid5 ids
+NODE_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, 'https://github.com/JoseMarshall/mlds-gdpr/node')
+
+# kind is CHAPTER, SECTION, ARTICLE, POINT or SUBPOINT; start/end are offsets
+# in the text and groups the captured parts of the heading (see tokenize)
+Event = namedtuple('Event', ['kind', 'start', 'end', 'groups'])
+
+
+def node_id(path, class_type, content):
+    """
+    Key of a TITLE_ID/TITLE/ARTICLE child node: a UUID derived from its
+    structural path, class type and content instead of a random one, so
+    regenerating an unchanged document gives byte-identical JSON
+    """
+    return str(uuid.uuid5(NODE_ID_NAMESPACE, f"{path}\x1f{class_type}\x1f{content}"))
+
+
+@lru_cache(maxsize=None)
+def language_patterns(language=DEFAULT_LANGUAGE):
+    """
+    Compiled patterns of a language of LANGUAGES:
+
+    - heading_patterns: CHAPTER, SECTION and ARTICLE headings. The section and
+      article words are matched bare since they also end chapter titles. Each
+      pattern is searched on its own, as re finds a literal prefix much faster
+      than an alternation of the three.
+    - chapter_title: matched at the end of a chapter heading
+    - article: matched at an article heading, within its chapter
+
+    :raises KeyError: for a language without heading patterns
+    """
+    words = LANGUAGES[language]
+    return Patterns(
+        heading_patterns={
+            'CHAPTER': re.compile(words.chapter),
+            'SECTION': re.compile(words.section),
+            'ARTICLE': re.compile(words.article),
+        },
+        chapter_title=re.compile(rf'\s*(.+?)(?=\s*(?:{words.article})|\s*(?:{words.section})|$)', re.DOTALL),
+        article=re.compile(rf'{words.article}{words.article_number}\s*(.*?)'
+                           rf'(?=\s*\(|\s*1\.|(?:{words.title_end})|$)'),
+    )
+
+
+def article_events(text, start, end):
+    """
+    POINT and SUBPOINT events of the article text text[start:end]
+    """
+    article_text = text[start:end]
+    for point in POINT_PATTERN.finditer(article_text):
+        yield Event('POINT', start + point.start(), start + point.end(), point.groups())
+        point_start = start + point.start(2)
+        for subpoint in SUBPOINT_PATTERN.finditer(point.group(2)):
+            yield Event('SUBPOINT', point_start + subpoint.start(), point_start + subpoint.end(),
+                        subpoint.groups())
+
+
+def close_article(text, article, end, sections):
+    """
+    Events of the points of an article ending at end, in document order with
+    the SECTION events found in the meantime
+    """
+    if article is None:
+        return sections
+    return sorted(list(article_events(text, article.end, end)) + sections, key=attrgetter('start'))
+
+
+def scan_heading_kind(text, kind, pattern):
+    for match in pattern.finditer(text):
+        yield match.start(), kind, match
+
+
+def scan_headings(text, heading_patterns):
+    """
+    (offset, kind, match) of every heading, in document order. The headings
+    never overlap, so merging the scans of each kind by offset is the same as
+    scanning for all of them at once.
+    """
+    return heapq.merge(*(scan_heading_kind(text, kind, pattern) for kind, pattern in heading_patterns.items()))
+
+
+def tokenize(text, language=DEFAULT_LANGUAGE):
+    """
+    Split a legal document into structural events, in document order:
+
+    - CHAPTER (heading, numeral, title or None)
+    - SECTION ()
+    - ARTICLE (number, title)
+    - POINT (number, text)
+    - SUBPOINT (letter, text)
+
+    The headings are found in one pass over the text. Titles are matched at
+    their heading and points/subpoints within the text of their article/point,
+    so every part of the text is only looked at a bounded number of times.
+
+    :param text: Formatted text of the document
+    :param language: Key of LANGUAGES the headings are written in
+    :return: Generator of Event
+    """
+    patterns = language_patterns(language)
+    headings = list(scan_headings(text, patterns.heading_patterns))
+
+    # Where the title of each article heading must end: at the next article or
+    # chapter heading
+    title_ends = []
+    title_end = len(text)
+    for start, kind, heading in reversed(headings):
+        title_ends.append(title_end)
+        if kind != 'SECTION':
+            title_end = start
+    title_ends.reverse()
+
+    in_chapter = False
+    article = None  # Last ARTICLE, its points end where the next article starts
+    sections = []  # SECTION events within the text of that article
+    resume = 0  # Articles are not matched inside the previous article heading
+    for (start, kind, heading), title_end in zip(headings, title_ends):
+        if kind == 'CHAPTER':
+            yield from close_article(text, article, heading.start(), sections)
+            article, sections = None, []
+            title_match = patterns.chapter_title.match(text, heading.end())
+            title = title_match.group(1) if title_match else None
+            yield Event('CHAPTER', heading.start(), heading.end(),
+                        (heading.group(0), heading.group(1), title))
+            in_chapter = True
+            resume = heading.end()
+        elif kind == 'SECTION':
+            section = Event('SECTION', heading.start(), heading.end(), ())
+            if article is None:
+                yield section
+            else:
+                sections.append(section)
+        elif in_chapter and start >= resume:
+            article_match = patterns.article.match(text, start, title_end)
+            if article_match is None:
+                continue
+            yield from close_article(text, article, article_match.start(), sections)
+            sections = []
+            article = Event('ARTICLE', article_match.start(), article_match.end(), article_match.groups())
+            yield article
+            resume = article_match.end()
+    yield from close_article(text, article, len(text), sections)
+
+
+def parse_legal_document(text, language=DEFAULT_LANGUAGE):
+    article_word = LANGUAGES[language].article
     document = {}
+    chapter_index = 0
+
+    for event in tokenize(text, language):
+        if event.kind == 'CHAPTER':
+            full_chapter, chapter_numeral, chapter_title = event.groups
+            chapter_index += 1
 
-    # Find all chapters
-    chapters = re.findall(r'(CAPO\s+([IVXLCDM]+))', text)
-
-    for chapter_index, (full_chapter, chapter_numeral) in enumerate(chapters, 1):
-        # Create chapter key
-        chapter_key = f"cpt_{chapter_index}"
-
-        # Find the chapter title
-        chapter_title_match = re.search(
-            rf'{full_chapter}\s*(.+?)(?=\s*Articolo|\s*Sezione|$)',
-            text,
-            re.DOTALL
-        )
-        chapter_title = chapter_title_match.group(1).strip() if chapter_title_match else "Untitled Chapter"
-
-        # Initialize chapter dictionary
-        document[chapter_key] = {
-            "classType": "CHAPTER",
-            "content": {
-                # Chapter Title ID
-                str(uuid.uuid4()): {
-                    "classType": "TITLE_ID",
-                    "content": full_chapter
-                },
-                # Chapter Title
-                str(uuid.uuid4()): {
-                    "classType": "TITLE",
-                    "content": {
-                        str(uuid.uuid4()): {
-                            "classType": "TITLE",
-                            "content": chapter_title
+            # Create chapter key
+            chapter_key = f"cpt_{chapter_index}"
+            chapter_title = chapter_title.strip() if chapter_title is not None else "Untitled Chapter"
+
+            # Initialize chapter dictionary
+            document[chapter_key] = {
+                "classType": "CHAPTER",
+                "content": {
+                    # Chapter Title ID
+                    node_id(chapter_key, "TITLE_ID", full_chapter): {
+                        "classType": "TITLE_ID",
+                        "content": full_chapter
+                    },
+                    # Chapter Title
+                    node_id(chapter_key, "TITLE", chapter_title): {
+                        "classType": "TITLE",
+                        "content": {
+                            node_id(f"{chapter_key}/TITLE", "TITLE", chapter_title): {
+                                "classType": "TITLE",
+                                "content": chapter_title
+                            }
                         }
                     }
                 }
             }
-        }
-        # Find the text for this specific chapter
-        chapter_start = text.find(full_chapter)
-        next_chapter_match = re.search(r'CAPO\s+[IVXLCDM]+', text[chapter_start + len(full_chapter):])
-
-        if next_chapter_match:
-            chapter_text = text[chapter_start + len(full_chapter):chapter_start + len(
-                full_chapter) + next_chapter_match.start()]
-        else:
-            chapter_text = text[chapter_start + len(full_chapter):]
 
-        # Find all articles with their numbers, titles, and content
-        article_matches = list(re.finditer(r'Articolo (\d+)\s*(.*?)(?=\s*\(|\s*1\.|(?:\s+[A-Z][a-z]+(?!\s*Unione)))', chapter_text))
-
-        for i, article_match in enumerate(article_matches):
+        elif event.kind == 'ARTICLE':
             # Extract article number and title
-            article_number = article_match.group(1)
-            article_title = article_match.group(2).strip() if article_match.group(2) else "No Title"
-
-            # Find the content of the article
-            article_start = article_match.end()
-            next_article_match = article_matches[i + 1] if i + 1 < len(article_matches) else None
-            article_text = chapter_text[article_start:next_article_match.start()] if next_article_match else chapter_text[article_start:]
+            article_number, article_title = event.groups
+            article_title = article_title.strip() if article_title else "No Title"
 
             # Create article key
             article_key = f"{chapter_key}.art_{article_number}"
@@ -72,60 +237,89 @@ def parse_legal_document(text):
                 "classType": "ARTICLE",
                 "content": {
                     # Article ID
-                    str(uuid.uuid4()): {
+                    node_id(article_key, "ARTICLE", f"{article_word} {article_number}"): {
                         "classType": "ARTICLE",
-                        "content": f"Articolo {article_number}"
+                        "content": f"{article_word} {article_number}"
                     },
                     # Article Title
-                    str(uuid.uuid4()): {
+                    node_id(article_key, "TITLE", article_title): {
                         "classType": "TITLE",
                         "content": article_title
                     },
                     "points": {}
                 }
             }
+            document[chapter_key]["content"][article_key] = article_dict
+            point_index = 0
 
-            # Parse points
-            points = re.findall(r'(?<!\()\b(\d+)[\.\)]\s(.+?)(?=\d+[\.\)]\s|$)', article_text, re.DOTALL)
-            for j, (point_num, point_text) in enumerate(points, 1):
-                point_key = f"{article_key}.pt_{j}"
-                point_dict = {
-                    "classType": "POINT",
-                    "content": point_text.strip()
-                }
-                # Check for subpoints
-                subpoints = re.findall(r'\b([a-z])\)\s*(.+?)(?=\b[a-z]\)|$)', point_text, re.DOTALL | re.MULTILINE)
-                if subpoints:
-                    point_dict["subpoints"] = {}
-                    for k, (subpoint_letter, subpoint_text) in enumerate(subpoints, 1):
-                        subpoint_key = f"{point_key}.spt_{subpoint_letter}"
-                        point_dict["subpoints"][subpoint_key] = {
-                            "classType": "SUBPOINT",
-                            "content": [f"{subpoint_letter})", subpoint_text.strip()]
-                        }
-
-                article_dict["content"]["points"][point_key] = point_dict
+        elif event.kind == 'POINT':
+            point_num, point_text = event.groups
+            point_index += 1
+            point_key = f"{article_key}.pt_{point_index}"
+            point_dict = {
+                "classType": "POINT",
+                "content": point_text.strip()
+            }
+            article_dict["content"]["points"][point_key] = point_dict
 
-            document[chapter_key]["content"][article_key] = article_dict
+        elif event.kind == 'SUBPOINT':
+            subpoint_letter, subpoint_text = event.groups
+            subpoint_key = f"{point_key}.spt_{subpoint_letter}"
+            point_dict.setdefault("subpoints", {})[subpoint_key] = {
+                "classType": "SUBPOINT",
+                "content": [f"{subpoint_letter})", subpoint_text.strip()]
+            }
 
     return document
 
 
+def dataset_point(point_key, point):
+    """
+    A POINT of parse_legal_document as a dataset node. The text of a point with
+    subpoints becomes a dict of its introductory text, in a POINT node keyed
+    <point key>.pt_<n> (e.g. "cpt_1.art_2.pt_2.pt_2"), and its SUBPOINT nodes.
+    """
+    subpoints = point.get("subpoints")
+    if not subpoints:
+        return {"classType": "POINT", "content": point["content"]}
+    first_subpoint = SUBPOINT_PATTERN.search(point["content"])
+    intro = point["content"][:first_subpoint.start()].strip() if first_subpoint else point["content"]
+    content = {f"{point_key}.{point_key.rpartition('.')[2]}": {"classType": "POINT", "content": intro}}
+    content.update(subpoints)
+    return {"classType": "POINT", "content": content}
 
 
-# Example usage
-# Define the file path
-file_path = "gdpr_formatted.txt"
-
-# Read the file content
-with open(file_path, "r", encoding="utf-8") as file:
-    text = file.read()
+def dataset_layout(document):
+    """
+    Lay out a document of parse_legal_document like the src/datasets/gdpr-*.json
+    read by to-turtle/main.py: the points of an article are nodes of its
+    content instead of being grouped under "points", and the subpoints of a
+    point are nodes of the point content (see dataset_point).
+    """
+    chapters = {}
+    for chapter_key, chapter in document.items():
+        chapter_content = {}
+        for key, node in chapter["content"].items():
+            if node["classType"] == "ARTICLE":
+                article_content = {child_key: child for child_key, child in node["content"].items()
+                                   if child_key != "points"}
+                for point_key, point in node["content"].get("points", {}).items():
+                    article_content[point_key] = dataset_point(point_key, point)
+                node = dict(node, content=article_content)
+            chapter_content[key] = node
+        chapters[chapter_key] = dict(chapter, content=chapter_content)
+    return chapters
 
-# Display the content stored in the text variable
 
+if __name__ == '__main__':
+    # Define the file path
+    file_path = "gdpr_formatted.txt"
 
+    # Read the file content
+    with open(file_path, "r", encoding="utf-8") as file:
+        text = file.read()
 
-result = parse_legal_document(text)
-# Save to JSON file
-with open('Chapter_structured.json', 'w', encoding='utf-8') as f:
-    json.dump(result, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+    result = parse_legal_document(text)
+    # Save to JSON file
+    with open('Chapter_structured.json', 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
@@ -2,17 +2,29 @@ import streamlit as st
 from rdflib import Graph, URIRef
 import networkx as nx
 import os
-from collections import Counter
+import math
 import matplotlib.pyplot as plt
 import re
-from unidecode import unidecode
+import time
 import urllib.parse
-from pyvis.network import Network
 import streamlit.components.v1 as components
+from ontology_cache import load_graph
+from ontology_locales import combine, is_split_ontology, locale_files, manifest_path, read_manifest
+from search_index import KeywordIndex
+from ontology_index import (
+    build_entity_profiles, build_related_map, document_order, load_alignment, load_overview_stats,
+    related_articles, translations_of,
+)
+from query_cache import QueryCache, run_query
+from query_runner import MAX_ROWS, QueryBusy, QueryPool, QueryTimeout
+from visualization import DETAIL_LEVELS, PREDICATES, build_view, render_html, view_locales
 
 
 query_params = st.query_params
 
+# Page sizes of the result tables; no more than 500 rows are rendered at once
+PAGE_SIZES = [25, 50, 100, 250, 500]
+
 
 
 # def show_entity_profile(entity_uri):
@@ -50,77 +62,57 @@ def show_entity_profile(entity_uri):
     """Display detailed information about a specific entity"""
     st.header("Entity Profile")
 
-    # Query to get all information about the entity
-    entity_query = """
-    PREFIX eli: <http://data.europa.eu/eli/ontology#>
-    SELECT ?predicate ?object
-    WHERE {
-        <%s> ?predicate ?object .
-    }
-    """
-
-    try:
-        results = ontology_graph.query(entity_query % entity_uri)
-
-        # Group the results by predicate for better organization
-        entity_data = {}
-        for row in results:
-            pred = str(row[0]).split('#')[-1]  # Get the predicate name
-            obj = str(row[1])
-            if pred not in entity_data:
-                entity_data[pred] = []
-            entity_data[pred].append(obj)
-
-        # Display entity information
-        st.subheader(f"Entity: {entity_uri.split('#')[-1]}")
-
-        # Create tabs for different types of information
-        tabs = st.tabs(["Basic Info", "Related Articles", "Implementation Details"])
-
-        with tabs[0]:
-            if "description" in entity_data:
-                st.markdown("### Description")
-                st.write(entity_data["description"][0])
-
-            if "title_alternative" in entity_data:
-                st.markdown("### Alternative Title")
-                st.write(entity_data["title_alternative"][0])
-
-        with tabs[1]:
-            # Query for related articles
-            related_query = """
-            PREFIX eli: <http://data.europa.eu/eli/ontology#>
-            SELECT ?related ?description
-            WHERE {
-                <%s> eli:implementation_of|eli:implementation_ensured_by ?related .
-                OPTIONAL { ?related eli:description ?description }
-            }
-            """ % entity_uri
-
-            related_results = ontology_graph.query(related_query)
-
-            st.markdown("### Related Articles")
-            for row in related_results:
-                with st.expander(f"{str(row[0]).split('#')[-1]}"):
-                    if len(row) > 1 and row[1]:
-                        st.write(str(row[1]))
-                    else:
-                        st.write("No description available")
-
-        with tabs[2]:
-            st.markdown("### Implementation Details")
-            implementation_details = {k: v for k, v in entity_data.items()
-                                      if "implementation" in k.lower()}
-            if implementation_details:
-                for pred, objs in implementation_details.items():
-                    st.markdown(f"**{pred}:**")
-                    for obj in objs:
-                        st.write(f"- {obj}")
-            else:
-                st.write("No implementation details available")
+    # Properties of the entity grouped by predicate name, from the profile index
+    entity_profiles = load_entity_profiles(ontology_graph, ontology_version)
+    entity_data = entity_profiles.get(entity_uri, {})
+
+    # Display entity information
+    st.subheader(f"Entity: {entity_uri.split('#')[-1]}")
+    if not entity_data:
+        st.warning("No information available for this entity")
+
+    # Create tabs for different types of information
+    tabs = st.tabs(["Basic Info", "Related Articles", "Implementation Details"])
+
+    with tabs[0]:
+        if "description" in entity_data:
+            st.markdown("### Description")
+            st.write(entity_data["description"][0])
+
+        if "title_alternative" in entity_data:
+            st.markdown("### Alternative Title")
+            st.write(entity_data["title_alternative"][0])
+
+        # Derived from the alignment table, the ontology may be built without
+        # the eli:has_translation triples
+        translations = translations_of(load_alignment_table(ontology_graph, ontology_file, ontology_version), entity_uri)
+        if translations:
+            st.markdown("### Translations")
+            st.markdown(
+                "<br>".join(generate_hyperlink(uri, determine_origin(locale)) for locale, uri in translations.items()),
+                unsafe_allow_html=True
+            )
 
-    except Exception as e:
-        st.error(f"Error loading entity profile: {e}")
+    with tabs[1]:
+        st.markdown("### Related Articles")
+        for related, description in related_articles(entity_profiles, entity_uri):
+            with st.expander(f"{related.split('#')[-1]}"):
+                if description:
+                    st.write(description)
+                else:
+                    st.write("No description available")
+
+    with tabs[2]:
+        st.markdown("### Implementation Details")
+        implementation_details = {k: v for k, v in entity_data.items()
+                                  if "implementation" in k.lower()}
+        if implementation_details:
+            for pred, objs in implementation_details.items():
+                st.markdown(f"**{pred}:**")
+                for obj in objs:
+                    st.write(f"- {obj}")
+        else:
+            st.write("No implementation details available")
 
 
 # Function to create hyperlinks
@@ -133,18 +125,110 @@ def generate_hyperlink(entity_uri, label):
 # Streamlit page configuration
 st.set_page_config(page_title="Ontology Dashboard", layout="wide")
 
-# Load ontology with caching
-@st.cache_resource
-def load_ontology():
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(current_dir, "abstract_updated.ttl")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Ontology file not found at: {file_path}")
-    g = Graph()
-    g.parse(file_path, format="turtle")
-    return g
+# GDPR_ONTOLOGY_FILE points the dashboard at another build, e.g. one made
+# from the synthetic datasets of to-turtle/benchmarks/generate_datasets.py, or
+# at the locales/ directory written by to-turtle/main.py --split
+ontology_file = os.environ.get(
+    "GDPR_ONTOLOGY_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "abstract_updated.ttl"),
+)
+if not os.path.exists(ontology_file):
+    raise FileNotFoundError(f"Ontology file not found at: {ontology_file}")
+# Everything cached below is keyed by the file version, so editing or
+# rebuilding the ontology reloads the graph and rebuilds the derived indexes
+ontology_stat = os.stat(manifest_path(ontology_file) if is_split_ontology(ontology_file) else ontology_file)
+file_version = (ontology_stat.st_mtime_ns, ontology_stat.st_size)
+
+# Load ontology with caching; a split ontology (to-turtle/main.py --split) is
+# cached file by file, so locales shared between sessions are loaded once
+@st.cache_resource(max_entries=64)
+def load_ontology(file_path, version):
+    # Loads the compiled cache of the file when it is up to date
+    return load_graph(file_path)
+
+if is_split_ontology(ontology_file):
+    # Only the core file and the locales selected here are loaded; GDPR_LOCALES
+    # (comma separated) sets the initial selection
+    manifest = read_manifest(ontology_file)
+    available_locales = list(manifest["locales"])
+    default_locales = [
+        locale for locale in os.environ.get("GDPR_LOCALES", "").split(",") if locale in available_locales
+    ] or available_locales[:1]
+    selected_locales = sorted(st.sidebar.multiselect("Locales", available_locales, default=default_locales))
+    ontology_version = file_version + tuple(selected_locales)
+    ontology_files = locale_files(ontology_file, manifest, selected_locales)
+    ontology_graph = combine([load_ontology(file_path, file_version) for file_path in ontology_files])
+else:
+    ontology_version = file_version
+    ontology_files = [ontology_file]
+    ontology_graph = load_ontology(ontology_file, ontology_version)
+
+# Derived indexes are kept for a few versions / locale selections at a time
+
+# Build the keyword search index once per loaded ontology
+@st.cache_resource(max_entries=4)
+def load_keyword_index(_graph, version):
+    return KeywordIndex(_graph)
+
+keyword_index = load_keyword_index(ontology_graph, ontology_version)
+
+# Related articles of every entity, resolved in one pass instead of per result row
+@st.cache_resource(max_entries=4)
+def load_related_map(_graph, version):
+    return build_related_map(_graph)
+
+related_map = load_related_map(ontology_graph, ontology_version)
+
+# Properties of every entity for the Entity Profile page, so following a link is
+# a dictionary lookup instead of two SPARQL queries; built on the first visit
+@st.cache_resource(max_entries=4)
+def load_entity_profiles(_graph, version):
+    return build_entity_profiles(_graph)
+
+# Alignment of the EU locales (abstract node -> node in each locale) for the
+# Parallel View and the translations of the Entity Profile page, read from the
+# abstract.alignment.json sidecar of the build when there is one
+@st.cache_resource(max_entries=4)
+def load_alignment_table(_graph, file_path, version):
+    return load_alignment(_graph, file_path)
+
+# Overview statistics, from the sidecar JSON of the build when there is one
+@st.cache_resource(max_entries=4)
+def load_stats(_graph, file_path, version):
+    return load_overview_stats(_graph, file_path)
+
+overview_stats = load_stats(ontology_graph, ontology_file, ontology_version)
 
-ontology_graph = load_ontology()
+# Results of Advanced Search queries, shared by all sessions
+@st.cache_resource(max_entries=4)
+def load_query_cache(version):
+    return QueryCache()
+
+query_cache = load_query_cache(ontology_version)
+
+# Advanced Search queries run in a small pool of worker processes, which load
+# the same files from the compiled cache when they are first needed
+@st.cache_resource(max_entries=4)
+def load_query_pool(file_paths, version):
+    return QueryPool(file_paths)
+
+query_pool = load_query_pool(tuple(ontology_files), ontology_version)
+
+# Locales offered by the Visualization page
+@st.cache_resource(max_entries=4)
+def load_visualization_locales(_graph, version):
+    return view_locales(_graph)
+
+visualization_locales = load_visualization_locales(ontology_graph, ontology_version)
+
+# Visualization HTML, generated once per (relations, locale, detail) combination
+@st.cache_resource(max_entries=64)
+def load_visualization(_graph, version, relations, locale, detail):
+    nodes, edges = build_view(_graph, relations, locale)
+    if len(nodes) < 10:
+        return None, 0, len(nodes)
+    net_html, shown_nodes = render_html(nodes, edges, DETAIL_LEVELS[detail])
+    return net_html, shown_nodes, len(nodes)
 
 # Initialize state for navigation
 if "active_section" not in st.session_state:
@@ -160,7 +244,7 @@ else:
     # Your existing navigation code
     section = st.sidebar.radio(
         "Go to:",
-        ["Overview", "Keyword Search", "Advanced Search", "Visualization"]
+        ["Overview", "Keyword Search", "Advanced Search", "Parallel View", "Visualization"]
     )
 st.session_state["active_section"] = section
 # if st.session_state["active_section"] == "Entity Profile":
@@ -216,6 +300,52 @@ def determine_origin(entity_name):
             return origin
     return "Unknown Origin"
 
+# Helper function: Links to the articles an entity implements or is implemented by
+def related_articles_html(entity_uri):
+    related_articles = [
+        generate_hyperlink(related, f"{related.split('#')[-1]} ({determine_origin(related.split('#')[-1])})")
+        for related in related_map.get(entity_uri, ())
+    ]
+    return "<br>".join(related_articles) if related_articles else "None"
+
+# Helper function: Columns of a Keyword Search / Advanced Search result row
+def result_columns(entity_uri, description, title_alt):
+    subject = entity_uri.split("#")[-1]
+    return {
+        "Origin": determine_origin(subject),
+        "Entity": generate_hyperlink(entity_uri, subject),
+        "Title Alternative": title_alt,
+        "Description": description,
+        "Related Articles": related_articles_html(entity_uri)
+    }
+
+# Helper function: Render one page of a result list as an HTML table. Only the
+# rows of the visible page are turned into columns and HTML.
+def show_result_page(key, rows, to_columns):
+    total = len(rows)
+    size_col, page_col, info_col = st.columns([1, 1, 2])
+    page_size = size_col.selectbox("Rows per page", PAGE_SIZES, index=1, key=f"{key}_page_size")
+    pages = max(1, math.ceil(total / page_size))
+    # A larger page size can leave the current page past the end
+    if st.session_state.get(f"{key}_page", 1) > pages:
+        st.session_state[f"{key}_page"] = pages
+    page = page_col.number_input("Page", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+    start = (page - 1) * page_size
+    end = min(start + page_size, total)
+    info_col.write(f"Rows {start + 1}–{end} of {total} ({pages} page(s))")
+
+    data = [to_columns(row) for row in rows[start:end]]
+    st.markdown(
+        "<table border='1'>" +
+        "<tr>" + "".join(f"<th>{key}</th>" for key in data[0].keys()) + "</tr>" +
+        "".join(
+            "<tr>" + "".join(f"<td>{row[key]}</td>" for key in row.keys()) + "</tr>"
+            for row in data
+        ) +
+        "</table>",
+        unsafe_allow_html=True
+    )
+
 # Entity profile display
 # def display_entity_profile(entity_uri):
 #     st.subheader("Entity Profile")
@@ -243,33 +373,27 @@ def determine_origin(entity_name):
 # Overview section
 if st.session_state["active_section"] == "Overview":
     st.header("Ontology Overview")
-    num_classes = len(set(ontology_graph.subjects(predicate=URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#type"))))
-    num_properties = len(set(ontology_graph.predicates()))
-    num_entities = len(set(ontology_graph.subjects()) | set(ontology_graph.objects()))
-    num_relationships = len(ontology_graph)
-    class_counts = Counter(
-        str(o).split("#")[-1]
-        for s, p, o in ontology_graph.triples((None, URIRef("http://www.w3.org/1999/02/22-rdf-syntax-ns#type"), None))
-    )
-    most_common_classes = class_counts.most_common(len(class_counts))
+    num_classes = overview_stats["typed_subjects"]
+    num_properties = overview_stats["predicates"]
+    num_entities = overview_stats["entities"]
+    num_relationships = overview_stats["triples"]
+    class_counts = overview_stats["class_counts"]
 
     st.write("### Classes")
-    st.bar_chart({k: v for k, v in most_common_classes})
+    st.bar_chart(class_counts)
 
-    sample_triples = list(ontology_graph)[2:5]
+    sample_triples = overview_stats["sample_triples"]
     st.write("### Example Triples")
     for triple in sample_triples:
         st.write(f"**Subject:** {triple[0]}  \n**Predicate:** {triple[1]}  \n**Object:** {triple[2]}")
 
-    st.write(f"**Total Triples:** {len(ontology_graph)}")
-    from collections import Counter
+    st.write(f"**Total Triples:** {num_relationships}")
 
-    property_counts = Counter(str(p).split("#")[-1] for p in ontology_graph.predicates())
-    most_common_properties = property_counts.most_common(len(property_counts))
+    property_counts = overview_stats["property_counts"]
 
     st.write("### Properties")
     st.write(f"**Number of Property types:** {len(property_counts)}")
-    st.bar_chart({k: v for k, v in most_common_properties})
+    st.bar_chart(property_counts)
 
 elif st.session_state["active_section"] == "Keyword Search":
     st.header(" Keyword Search")
@@ -281,62 +405,24 @@ elif st.session_state["active_section"] == "Keyword Search":
     # Execute the search when the button is clicked
     if st.button("Search"):
         try:
-            query = """
-                    PREFIX eli: <http://data.europa.eu/eli/ontology#>
-                    SELECT ?subject ?description ?title_alt
-                    WHERE {
-                        ?subject eli:description ?description ;
-                                eli:title_alternative ?title_alt .
-                    }
-                    """
-            results = ontology_graph.query(query)
-            data = []
-            for row in results:
-                entity_uri = str(row[0])
-                subject = entity_uri.split("#")[-1] if len(row) > 0 else ""
-                description = str(row[1]) if len(row) > 1 else ""
-                title_alt = str(row[2]) if len(row) > 2 else ""
-                normalized_description = unidecode(description).lower()
-                normalized_input = unidecode(search_input).lower()
-                if normalized_input in normalized_description:
-                    linked_query = f"""
-                            PREFIX eli: <http://data.europa.eu/eli/ontology#>
-                            SELECT ?related
-                            WHERE {{
-                                <{entity_uri}> eli:implementation_of|eli:implementation_ensured_by ?related .
-                            }}
-                            """
-                    linked_results = ontology_graph.query(linked_query)
-                    related_articles = [
-                        generate_hyperlink(str(linked_row[0]),
-                                           f"{str(linked_row[0]).split('#')[-1]} ({determine_origin(str(linked_row[0]).split('#')[-1])})")
-                        for linked_row in linked_results
-                    ]
-                    origin = determine_origin(subject)
-                    data.append({
-                        "Origin": origin,
-                        "Entity": generate_hyperlink(entity_uri, subject),
-                        "Title Alternative": title_alt,
-                        "Description": description,
-                        "Related Articles": "<br>".join(related_articles) if related_articles else "None"
-                    })
-            if data:
-                st.write("### Results")
-                st.markdown(
-                    "<table border='1'>" +
-                    "<tr>" + "".join(f"<th>{key}</th>" for key in data[0].keys()) + "</tr>" +
-                    "".join(
-                        "<tr>" + "".join(f"<td>{row[key]}</td>" for key in row.keys()) + "</tr>"
-                        for row in data
-                    ) +
-                    "</table>",
-                    unsafe_allow_html=True
-                )
-            else:
-                st.write("No results found.")
+            start = time.perf_counter()
+            results = keyword_index.search(search_input)
+            # Kept in the session so changing pages does not run the search again
+            st.session_state["keyword_search"] = (results, (time.perf_counter() - start) * 1000)
+            st.session_state["keyword_search_page"] = 1
         except Exception as e:
+            st.session_state.pop("keyword_search", None)
             st.error(f"Error performing keyword search: {e}")
 
+    if "keyword_search" in st.session_state:
+        results, elapsed_ms = st.session_state["keyword_search"]
+        st.caption(f"{len(results)} result(s) in {elapsed_ms:.1f} ms")
+        if results:
+            st.write("### Results")
+            show_result_page("keyword_search", results, lambda result: result_columns(*result))
+        else:
+            st.write("No results found.")
+
 
 
 # Search Ontology section
@@ -365,49 +451,51 @@ elif st.session_state["active_section"] == "Advanced Search":
 
     if st.button("Run SPARQL Query"):
         try:
-            results = ontology_graph.query(query)
-            data = []
-            for row in results:
-                entity_uri = str(row[0])
-                subject = entity_uri.split("#")[-1] if len(row) > 0 else ""
-                description = str(row[1]) if len(row) > 1 else ""
-                title_alt = str(row[2]) if len(row) > 2 else ""
-                origin = determine_origin(subject)
-                linked_query = f"""
-                PREFIX eli: <http://data.europa.eu/eli/ontology#>
-                SELECT ?related
-                WHERE {{
-                    <{entity_uri}> eli:implementation_of|eli:implementation_ensured_by ?related .
-                }}
-                """
-                linked_results = ontology_graph.query(linked_query)
-                related_articles = [
-                    generate_hyperlink(str(linked_row[0]), f"{str(linked_row[0]).split('#')[-1]} ({determine_origin(str(linked_row[0]).split('#')[-1])})")
-                    for linked_row in linked_results
-                ]
-                data.append({
-                    "Origin": origin,
-                    "Entity": generate_hyperlink(entity_uri, subject),
-                    "Title Alternative": title_alt,
-                    "Description": description,
-                    "Related Articles": "<br>".join(related_articles) if related_articles else "None"
-                })
-            if data:
+            result, cached, elapsed_ms = run_query(query_cache, query_pool, query)
+            status = (
+                f"{'Cached' if cached else 'Computed'} in {elapsed_ms:.1f} ms · "
+                f"cache hit rate {query_cache.hit_rate():.0%} "
+                f"({query_cache.hits}/{query_cache.hits + query_cache.misses}), "
+                f"{len(query_cache)} result(s) cached"
+            )
+            # Kept in the session so changing pages does not run the query again
+            st.session_state["sparql_search"] = (result, status)
+            st.session_state["sparql_search_page"] = 1
+        except QueryBusy as e:
+            st.session_state.pop("sparql_search", None)
+            st.warning(f"{e}. Try again in a moment.")
+        except QueryTimeout as e:
+            st.session_state.pop("sparql_search", None)
+            st.error(f"{e}. Add a LIMIT or a more specific pattern.")
+        except Exception as e:
+            st.session_state.pop("sparql_search", None)
+            st.error(f"Error executing SPARQL query: {e}")
+
+    if "sparql_search" in st.session_state:
+        result, status = st.session_state["sparql_search"]
+        st.caption(status)
+        if result.truncated:
+            st.warning(f"The query matched more than {MAX_ROWS} rows, only the first {MAX_ROWS} were kept. "
+                       "Add a LIMIT or a more specific pattern.")
+        try:
+            if result.type == "ASK":
+                st.write("### Result")
+                st.write(f"ASK: **{result.rows[0][0]}**")
+            elif result.rows:
                 st.write("### Results")
-                st.markdown(
-                    "<table border='1'>" +
-                    "<tr>" + "".join(f"<th>{key}</th>" for key in data[0].keys()) + "</tr>" +
-                    "".join(
-                        "<tr>" + "".join(f"<td>{row[key]}</td>" for key in row.keys()) + "</tr>"
-                        for row in data
-                    ) +
-                    "</table>",
-                    unsafe_allow_html=True
+                show_result_page(
+                    "sparql_search",
+                    result.rows,
+                    lambda row: result_columns(
+                        str(row[0]),
+                        str(row[1]) if len(row) > 1 else "",
+                        str(row[2]) if len(row) > 2 else "",
+                    ),
                 )
             else:
                 st.info("No results found for the given query.")
         except Exception as e:
-            st.error(f"Error executing SPARQL query: {e}")
+            st.error(f"Error displaying the query results: {e}")
 
 
 
@@ -424,107 +512,83 @@ elif st.session_state["active_section"] == "Entity Profile":
 
 
 
+# Parallel View section
+elif st.session_state["active_section"] == "Parallel View":
+    st.header("Parallel View")
+    st.write("Read an article of the regulation side by side in its languages.")
+
+    alignment = load_alignment_table(ontology_graph, ontology_file, ontology_version)
+    entity_profiles = load_entity_profiles(ontology_graph, ontology_version)
+
+    def first_value(uri, predicate):
+        return entity_profiles.get(uri, {}).get(predicate, [""])[0]
+
+    articles = sorted(
+        (uri for uri in alignment["nodes"] if uri.split("#")[-1].split(".")[-1].startswith("art_")),
+        key=document_order,
+    )
+    if not articles or len(alignment["locales"]) < 2:
+        st.warning("No articles are available in more than one locale. Select more locales or rebuild the ontology.")
+    else:
+        def article_label(uri):
+            realization = next(iter(alignment["nodes"][uri].values()))
+            return f"{first_value(realization, 'title_alternative')} – {first_value(realization, 'description')}"
+
+        article = st.selectbox("Article", articles, format_func=article_label)
+        parallel_locales = st.multiselect("Languages", alignment["locales"], default=alignment["locales"])
+
+        if parallel_locales:
+            # The article and its points, in document order
+            prefix = article + "."
+            rows = [article] + sorted(
+                (uri for uri in alignment["nodes"] if uri.startswith(prefix)), key=document_order
+            )
+            for col, locale in zip(st.columns(len(parallel_locales)), parallel_locales):
+                col.markdown(f"**{determine_origin(locale)}**")
+            for abstract_uri in rows:
+                realizations = alignment["nodes"][abstract_uri]
+                for col, locale in zip(st.columns(len(parallel_locales)), parallel_locales):
+                    uri = realizations.get(locale)
+                    if uri is None:
+                        col.write("—")
+                        continue
+                    col.markdown(
+                        generate_hyperlink(uri, first_value(uri, "title_alternative") or uri.split("#")[-1]),
+                        unsafe_allow_html=True
+                    )
+                    col.write(first_value(uri, "description"))
+
+
+
+
 # Visualization section
 elif st.session_state["active_section"] == "Visualization":
     st.header("Ontology Visualization")
     st.write("This section provides an interactive graph visualization of the ontology.")
 
-    # Create a Pyvis Network instance
-    net = Network(height="750px", width="100%", directed=True)
-
-    query = """
-    SELECT ?subject ?predicate ?object 
-    WHERE {
-        ?subject ?predicate ?object .
-        FILTER(
-            ?predicate IN (
-                <http://data.europa.eu/eli/ontology#is_realized_by>,
-                <http://data.europa.eu/eli/ontology#has_part>,
-                <http://data.europa.eu/eli/ontology#is_part_of>
-            ) || 
-            ?object IN (
-                <http://example.org/gdpr#GDPR>,
-                <http://example.org/rgdpr#>
-            )
-        )
-    }
-    """
+    relations = st.multiselect("Relations", list(PREDICATES), default=list(PREDICATES))
+    locale = st.selectbox("Locale", ["All locales"] + visualization_locales)
+    detail = st.select_slider("Level of detail", options=list(DETAIL_LEVELS), value="Article")
+    st.caption("Click a node to expand the parts and realizations below it.")
+
     with st.spinner("Generating interactive visualization..."):
         try:
-            results = ontology_graph.query(query)
-            count = 0
-            max_triples = 11000  # Adjust as needed for performance
-
-            # Dictionary to track added nodes and avoid duplicates
-            added_nodes = set()
-
-            for subject, predicate, obj in results:
-                subj_label = subject.split("/")[-1]
-                obj_label = obj.split("/")[-1]
-                pred_label = predicate.split("#")[-1]
-
-                # Add subject node if not already added
-                if subj_label not in added_nodes:
-                    net.add_node(subj_label,
-                                 label=subj_label,
-                                 title=subject,
-                                 color='#4CAF50')  # Green for classes
-                    added_nodes.add(subj_label)
-
-                # Add object node if not already added
-                if obj_label not in added_nodes:
-                    net.add_node(obj_label,
-                                 label=obj_label,
-                                 title=obj,
-                                 color='#2196F3')  # Blue for individuals
-                    added_nodes.add(obj_label)
-
-                # Add edge
-                net.add_edge(subj_label, obj_label, label=pred_label)
-                count += 1
-
-                if count >= max_triples:
-                    break
+            net_html, shown_nodes, total_nodes = load_visualization(
+                ontology_graph,
+                ontology_version,
+                tuple(sorted(relations)),
+                None if locale == "All locales" else locale,
+                detail,
+            )
 
             # Check if the graph has at least 10 nodes
-            if len(added_nodes) < 10:
-                st.warning("The generated graph contains fewer than 10 nodes. No visualization will be displayed.")
-            elif count == 0:
+            if total_nodes == 0:
                 st.warning("No data available to visualize. Please ensure the ontology contains relevant triples.")
+            elif total_nodes < 10:
+                st.warning("The generated graph contains fewer than 10 nodes. No visualization will be displayed.")
             else:
-                # Customize Pyvis options
-                net.set_options("""
-                var options = {
-                  "edges": {
-                    "arrows": {
-                      "to": {
-                        "enabled": true
-                      }
-                    },
-                    "color": {
-                      "inherit": true
-                    },
-                    "smooth": false
-                  },
-                  "physics": {
-                    "enabled": true,
-                    "stabilization": {
-                      "enabled": true,
-                      "iterations": 200
-                    }
-                  }
-                }
-                """)
-
-                # Generate and display the interactive visualization
-                net_html = "graph.html"
-                net.save_graph(net_html)
-                components.html(open(net_html, "r").read(), height=750, scrolling=True)
+                st.write(f"Showing {shown_nodes} of {total_nodes} nodes.")
+                components.html(net_html, height=750, scrolling=True)
 
         except Exception as e:
             st.error(f"Visualization error: {e}")
-
-
-
-
-
@@ -0,0 +1,184 @@
+"""
+Compiled on-disk cache of the dashboard ontology.
+
+Parsing the Turtle ontology dominates every cold start of the dashboard. The
+cache stores the graph as a table of terms plus a flat array of integer
+(subject, predicate, object) ids, which loads into an rdflib Graph in a
+fraction of the parse time. Cache files are keyed by the ontology file's
+mtime, size and sha256 and are rebuilt automatically when it changes.
+
+Prebuild the cache, e.g. while building a container image:
+    python src/dashboard/src/ontology_cache.py src/dashboard/src/abstract_updated.ttl
+"""
+
+import array
+import gc
+import hashlib
+import os
+import pickle
+import sys
+
+import rdflib
+from rdflib import BNode, Graph, Literal, URIRef
+from rdflib.util import guess_format
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".ontology-cache"
+)
+
+URI, BNODE, LITERAL = range(3)
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path(file_path, cache_dir=DEFAULT_CACHE_DIR):
+    # Include a digest of the absolute path so two ontologies with the same
+    # file name never overwrite each other's cache
+    path_digest = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+    return os.path.join(
+        cache_dir, f"{os.path.basename(file_path)}.{path_digest[:12]}.graph"
+    )
+
+
+def encode_term(term):
+    if isinstance(term, URIRef):
+        return (URI, str(term), None, None)
+    if isinstance(term, BNode):
+        return (BNODE, str(term), None, None)
+    datatype = str(term.datatype) if term.datatype is not None else None
+    return (LITERAL, str(term), datatype, term.language)
+
+
+def decode_term(kind, value, datatype, language):
+    if kind == URI:
+        return URIRef(value)
+    if kind == BNODE:
+        return BNode(value)
+    return Literal(value, lang=language, datatype=datatype)
+
+
+def encode_graph(graph):
+    """Return (terms, ids, namespaces) with ids a flat array of term indexes."""
+    term_ids = {}
+    terms = []
+    ids = array.array("I")
+    for triple in graph:
+        for term in triple:
+            term_id = term_ids.get(term)
+            if term_id is None:
+                term_id = term_ids[term] = len(terms)
+                terms.append(encode_term(term))
+            ids.append(term_id)
+    namespaces = [(prefix, str(namespace)) for prefix, namespace in graph.namespaces()]
+    return terms, ids, namespaces
+
+
+def decode_graph(terms, ids, namespaces):
+    graph = Graph()
+    for prefix, namespace in namespaces:
+        graph.bind(prefix, namespace, override=True)
+    nodes = [decode_term(*term) for term in terms]
+    it = iter(ids)
+    # The store allocates several dicts per triple; the cyclic garbage collector
+    # would otherwise rescan them over and over while the graph is being filled
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        graph.addN((nodes[s], nodes[p], nodes[o], graph) for s, p, o in zip(it, it, it))
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return graph
+
+
+def read_header(f):
+    header = pickle.load(f)
+    if not isinstance(header, dict) or header.get("version") != CACHE_VERSION:
+        return None
+    if header.get("rdflib") != rdflib.__version__:
+        return None
+    return header
+
+
+def make_header(stat, sha256):
+    return {
+        "version": CACHE_VERSION,
+        "rdflib": rdflib.__version__,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": sha256,
+    }
+
+
+def write_cache(path, header, body):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write to a temporary file first so a crash never leaves a truncated cache
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.write(body)
+    os.replace(tmp_path, path)
+
+
+def load_cached(path, stat, file_path):
+    """Return the graph of a cache file matching file_path, or None."""
+    try:
+        with open(path, "rb") as f:
+            header = read_header(f)
+            if header is None:
+                return None
+            body = f.read()
+        if (header["mtime_ns"], header["size"]) != (stat.st_mtime_ns, stat.st_size):
+            # Touched (e.g. by a checkout) but maybe not changed
+            if header["sha256"] != file_hash(file_path):
+                return None
+            try:
+                write_cache(path, make_header(stat, header["sha256"]), body)
+            except OSError:
+                pass
+        terms, raw_ids, namespaces = pickle.loads(body)
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, ValueError):
+        return None
+    ids = array.array("I")
+    ids.frombytes(raw_ids)
+    return decode_graph(terms, ids, namespaces)
+
+
+def load_graph(file_path, format=None, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Load an ontology file into an rdflib Graph, through the compiled cache.
+
+    The file is only parsed when no cache entry matches it; the parsed graph is
+    then written to the cache for the next start. A read-only cache directory
+    just means every start parses the file.
+    """
+    stat = os.stat(file_path)
+    path = cache_path(file_path, cache_dir)
+    graph = load_cached(path, stat, file_path)
+    if graph is not None:
+        return graph
+
+    graph = Graph()
+    graph.parse(file_path, format=format or guess_format(file_path) or "turtle")
+    terms, ids, namespaces = encode_graph(graph)
+    body = pickle.dumps(
+        (terms, ids.tobytes(), namespaces), protocol=pickle.HIGHEST_PROTOCOL
+    )
+    try:
+        write_cache(path, make_header(stat, file_hash(file_path)), body)
+    except OSError:
+        pass
+    return graph
+
+
+if __name__ == "__main__":
+    for file_path in sys.argv[1:]:
+        graph = load_graph(file_path)
+        print(f"{file_path}: {len(graph)} triples cached in {cache_path(file_path)}")
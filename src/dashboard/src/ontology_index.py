@@ -0,0 +1,209 @@
+"""
+Lookup tables and statistics derived from the ontology once when it is loaded,
+so the dashboard does not have to query the graph again on every rerun.
+"""
+
+import json
+import os
+from collections import Counter
+
+from rdflib import Namespace
+from rdflib.namespace import RDF
+
+from ontology_cache import file_hash
+
+ELI = Namespace("http://data.europa.eu/eli/ontology#")
+GDPR = Namespace("http://example.org/gdpr#")
+RGDPR = Namespace("http://example.org/rgdpr#")
+
+RELATED_PREDICATES = (ELI.implementation_of, ELI.implementation_ensured_by)
+
+
+def build_related_map(graph):
+    """
+    Map every entity URI to the URIs it is linked to by eli:implementation_of or
+    eli:implementation_ensured_by.
+    """
+    related = {}
+    for predicate in RELATED_PREDICATES:
+        for subject, obj in graph.subject_objects(predicate):
+            related.setdefault(str(subject), []).append(str(obj))
+    return related
+
+
+def local_name(term):
+    return str(term).split("#")[-1]
+
+
+def build_entity_profiles(graph):
+    """
+    Map every subject URI to its objects grouped by predicate local name
+    (description, title_alternative, implementation_of, has_translation, ...),
+    in one pass over the graph. The Entity Profile page looks entities up here
+    instead of querying the graph each time a link is followed.
+    """
+    profiles = {}
+    for s, p, o in graph:
+        profiles.setdefault(str(s), {}).setdefault(local_name(p), []).append(str(o))
+    return profiles
+
+
+def related_articles(profiles, entity_uri):
+    """
+    (URI, description or None) of the entities linked from entity_uri by
+    eli:implementation_of or eli:implementation_ensured_by.
+    """
+    profile = profiles.get(entity_uri, {})
+    return [
+        (related, profiles.get(related, {}).get("description", [None])[0])
+        for predicate in RELATED_PREDICATES
+        for related in profile.get(local_name(predicate), ())
+    ]
+
+
+def compute_overview_stats(graph):
+    """
+    Statistics of the Overview page in a single pass over the graph, in the
+    layout of the abstract.stats.json sidecar written by to-turtle/main.py.
+    """
+    typed_subjects = set()
+    predicates = set()
+    entities = set()
+    class_counts = Counter()
+    property_counts = Counter()
+    first_triples = []
+    for triple in graph:
+        s, p, o = triple
+        predicates.add(p)
+        entities.add(s)
+        entities.add(o)
+        property_counts[local_name(p)] += 1
+        if p == RDF.type:
+            typed_subjects.add(s)
+            class_counts[local_name(o)] += 1
+        if len(first_triples) < 5:
+            first_triples.append(triple)
+    return {
+        "triples": len(graph),
+        "typed_subjects": len(typed_subjects),
+        "predicates": len(predicates),
+        "entities": len(entities),
+        "class_counts": dict(class_counts.most_common()),
+        "property_counts": dict(property_counts.most_common()),
+        "sample_triples": [
+            [str(term) for term in triple] for triple in first_triples[2:5]
+        ],
+    }
+
+
+def load_overview_stats(graph, file_path):
+    """
+    Read the stats sidecar of the ontology file (abstract.ttl ->
+    abstract.stats.json) when it was written for this exact file, otherwise
+    compute the statistics from the graph.
+    """
+    sidecar = os.path.splitext(file_path)[0] + ".stats.json"
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            stats = json.load(f)
+        if stats.get("ontology_sha256") == file_hash(file_path):
+            return stats
+    except (OSError, ValueError):
+        pass
+    return compute_overview_stats(graph)
+
+
+def build_alignment(graph):
+    """
+    Alignment table of the EU locales in the layout of the
+    abstract.alignment.json sidecar written by to-turtle/main.py: abstract node
+    id -> {locale: concrete node id}, from the eli:realizes links. The EU
+    locales are those realizing gdpr:GDPR (rgdpr:gdpr_<locale>).
+    """
+    realizations = [
+        (str(s)[len(RGDPR) :], str(o)[len(GDPR) :])
+        for s, o in graph.subject_objects(ELI.realizes)
+        if str(s).startswith(RGDPR) and str(o).startswith(GDPR)
+    ]
+    locales = sorted(
+        concrete_id[len("gdpr_") :]
+        for concrete_id, key in realizations
+        if key == "GDPR"
+    )
+    nodes = {}
+    for concrete_id, key in realizations:
+        for locale in locales:
+            if concrete_id.endswith("_" + locale):
+                nodes.setdefault(key, {})[locale] = concrete_id
+                break
+    return {
+        "abstract_namespace": str(GDPR),
+        "concrete_namespace": str(RGDPR),
+        "locales": locales,
+        "nodes": nodes,
+    }
+
+
+def load_alignment(graph, file_path):
+    """
+    Alignment table of the ontology, read from its sidecar (abstract.ttl ->
+    abstract.alignment.json) when it was written for this exact file, otherwise
+    computed from the graph. Node ids are expanded to URIs, and abstract_of maps
+    every concrete node back to its abstract node.
+    """
+    sidecar = os.path.splitext(file_path)[0] + ".alignment.json"
+    table = None
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            table = json.load(f)
+        if table.get("ontology_sha256") != file_hash(file_path):
+            table = None
+    except (OSError, ValueError):
+        pass
+    if table is None:
+        table = build_alignment(graph)
+
+    abstract_ns = table["abstract_namespace"]
+    concrete_ns = table["concrete_namespace"]
+    nodes = {
+        abstract_ns
+        + key: {
+            locale: concrete_ns + concrete_id
+            for locale, concrete_id in realizations.items()
+        }
+        for key, realizations in table["nodes"].items()
+    }
+    abstract_of = {
+        concrete_uri: abstract_uri
+        for abstract_uri, realizations in nodes.items()
+        for concrete_uri in realizations.values()
+    }
+    return {"locales": table["locales"], "nodes": nodes, "abstract_of": abstract_of}
+
+
+def translations_of(alignment, entity_uri):
+    """
+    {locale: URI} of the translations of a concrete EU node, derived from the
+    alignment table, so they are available even when the ontology was built
+    without the eli:has_translation triples.
+    """
+    abstract_uri = alignment["abstract_of"].get(entity_uri)
+    if abstract_uri is None:
+        return {}
+    return {
+        locale: uri
+        for locale, uri in alignment["nodes"][abstract_uri].items()
+        if uri != entity_uri
+    }
+
+
+def document_order(uri):
+    """
+    Sort key putting node ids in document order, e.g. cpt_1.art_2.pt_10 after
+    cpt_1.art_2.pt_9 and cpt_1.art_2.pt_1.spt_a right after cpt_1.art_2.pt_1.
+    """
+    key = []
+    for component in local_name(uri).split("."):
+        prefix, _, value = component.rpartition("_")
+        key.append((prefix, int(value) if value.isdigit() else 0, value))
+    return key
@@ -0,0 +1,50 @@
+"""
+Locale-scoped loading of the ontology split by to-turtle/main.py --split.
+
+The build writes locales/core.ttl (schema and EU abstract layer), one file per
+EU locale and member state, and an index.json manifest. The dashboard loads the
+core file plus the locales a user selects, each through the compiled cache of
+ontology_cache, and queries them together as one read-only graph.
+"""
+
+import json
+import os
+
+from rdflib.graph import ReadOnlyGraphAggregate
+
+MANIFEST = "index.json"
+
+
+def is_split_ontology(path):
+    """Whether path is the manifest, or the directory, of a split ontology."""
+    if os.path.isdir(path):
+        return os.path.exists(os.path.join(path, MANIFEST))
+    return os.path.basename(path) == MANIFEST
+
+
+def manifest_path(path):
+    return os.path.join(path, MANIFEST) if os.path.isdir(path) else path
+
+
+def read_manifest(path):
+    with open(manifest_path(path), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def locale_files(path, manifest, locales):
+    """Paths of the core file and of the files of the given locales."""
+    base_dir = os.path.dirname(manifest_path(path))
+    unknown = [locale for locale in locales if locale not in manifest["locales"]]
+    if unknown:
+        raise ValueError(f"Unknown locale(s): {', '.join(unknown)}")
+    return [os.path.join(base_dir, manifest["core"])] + [
+        os.path.join(base_dir, manifest["locales"][locale]["file"])
+        for locale in locales
+    ]
+
+
+def combine(graphs):
+    # The locale files do not share triples, so no union graph has to be built
+    if len(graphs) == 1:
+        return graphs[0]
+    return ReadOnlyGraphAggregate(graphs)
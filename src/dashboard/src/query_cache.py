@@ -0,0 +1,93 @@
+"""
+Bounded LRU cache of SPARQL query results for the Advanced Search section.
+
+Queries are keyed by their text without comments and with insignificant
+whitespace collapsed, so re-running a sidebar example with different
+indentation is still a hit. The cache accounts for the approximate size of the
+cached rows and evicts the least recently used results beyond max_bytes or
+max_entries. One cache is created per ontology version, which is how it gets
+invalidated when the file changes.
+"""
+
+import re
+import time
+from collections import OrderedDict
+
+from query_runner import MAX_ROWS, QUERY_TIMEOUT
+
+# String literals and IRIs (which may contain "#") are kept verbatim. Elsewhere
+# a run of whitespace and "#" comments becomes one space: a comment ends at its
+# line break, so collapsing that first would comment out the rest of the query.
+WHITESPACE_PATTERN = re.compile(
+    r'("""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\''
+    r'|<[^<>"{}|^`\\\s]*>)|(?:\s|#[^\n]*)+'
+)
+ROW_OVERHEAD = 64
+
+
+def normalize_query(query):
+    return WHITESPACE_PATTERN.sub(lambda m: m.group(1) or " ", query).strip()
+
+
+def rows_size(rows):
+    """Approximate memory held by result rows, in bytes."""
+    return sum(
+        ROW_OVERHEAD + sum(len(value) for value in row if value is not None)
+        for row in rows
+    )
+
+
+class QueryCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_entries=256):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, query):
+        key = normalize_query(query)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, query, value, size):
+        if size > self.max_bytes:
+            # Never let one huge result flush the whole cache
+            return
+        key = normalize_query(query)
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        self.entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_bytes or len(self.entries) > self.max_entries:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def run_query(cache, pool, query, timeout=QUERY_TIMEOUT, max_rows=MAX_ROWS):
+    """
+    Return (QueryResult, cached, milliseconds) for a SPARQL query, evaluating it
+    with a query_runner.QueryPool only when its result is not cached yet. Queries
+    that time out or fail are not cached.
+    """
+    start = time.perf_counter()
+    result = cache.get(query)
+    cached = result is not None
+    if not cached:
+        result = pool.execute(query, timeout, max_rows)
+        cache.put(query, result, rows_size(result.rows))
+    return result, cached, (time.perf_counter() - start) * 1000
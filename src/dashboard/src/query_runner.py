@@ -0,0 +1,231 @@
+"""
+SPARQL execution for the dashboard with a wall-clock budget and a row cap.
+
+rdflib evaluates queries in pure Python and cannot be interrupted, so queries
+run in a QueryWorker: a process started with "spawn", which is safe from the
+threads of the Streamlit server, and which loads its own copy of the ontology
+files through the compiled cache of ontology_cache. The worker stays up between
+queries. Rows are streamed back to the dashboard in chunks, evaluation stops
+once max_rows rows have been produced, and the worker is killed when the budget
+runs out or the Streamlit run is stopped; the next query starts a new one.
+
+A QueryPool holds a few workers so that one heavy query does not hold up the
+other sessions. A query that finds every worker busy fails at once with
+QueryBusy instead of queueing, and loading a worker counts against the budget
+of the query that started it.
+
+SELECT rows are returned as they are, ASK as a single (answer,) row and
+CONSTRUCT / DESCRIBE as (subject, predicate, object) rows.
+"""
+
+import multiprocessing
+import threading
+import time
+import weakref
+from collections import namedtuple
+
+from rdflib import Literal
+from rdflib.plugins.sparql import prepareQuery
+
+from ontology_cache import load_graph
+from ontology_locales import combine
+
+QUERY_TIMEOUT = 20.0
+# Each worker holds its own copy of the graph
+POOL_SIZE = 2
+MAX_ROWS = 10000
+CHUNK_ROWS = 500
+
+# type: the SPARQL query form, "SELECT", "ASK", "CONSTRUCT" or "DESCRIBE"
+QueryResult = namedtuple("QueryResult", ["rows", "truncated", "type"])
+
+
+class QueryTimeout(Exception):
+    pass
+
+
+class QueryFailed(Exception):
+    pass
+
+
+class QueryBusy(Exception):
+    pass
+
+
+def result_rows(result):
+    if result.type == "ASK":
+        yield (Literal(result.askAnswer),)
+    elif result.type in ("CONSTRUCT", "DESCRIBE"):
+        yield from result.graph
+    else:
+        for row in result:
+            yield tuple(row)
+
+
+def iter_messages(graph, query, max_rows):
+    """
+    Yield ("type", query form), then ("rows", list of rows) chunks, then
+    ("done", whether the result was cut at max_rows).
+    """
+    result = graph.query(query)
+    yield "type", result.type
+    chunk = []
+    count = 0
+    for row in result_rows(result):
+        if count == max_rows:
+            if chunk:
+                yield "rows", chunk
+            yield "done", True
+            return
+        chunk.append(row)
+        count += 1
+        if len(chunk) == CHUNK_ROWS:
+            yield "rows", chunk
+            chunk = []
+    if chunk:
+        yield "rows", chunk
+    yield "done", False
+
+
+def serve(file_paths, conn):
+    """Worker process: load the ontology, then answer queries until the pipe closes."""
+    try:
+        graph = combine([load_graph(file_path) for file_path in file_paths])
+        # rdflib sets up its SPARQL parser on first use
+        prepareQuery("SELECT * WHERE { ?s ?p ?o } LIMIT 1")
+    except Exception as e:
+        conn.send(("error", f"Could not load the ontology: {type(e).__name__}: {e}"))
+        return
+    conn.send(("ready", len(graph)))
+
+    while True:
+        try:
+            query, max_rows = conn.recv()
+        except EOFError:
+            return
+        try:
+            for message in iter_messages(graph, query, max_rows):
+                conn.send(message)
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+def stop(process, conn):
+    conn.close()
+    if process.is_alive():
+        process.kill()
+    process.join()
+
+
+class QueryWorker:
+    """
+    A worker process answering the queries of one set of ontology files, e.g.
+    the core and selected locale files of a split ontology. It is started on
+    its first query and answers one query at a time; lock is held by the
+    thread whose query it runs.
+    """
+
+    def __init__(self, file_paths):
+        self.file_paths = list(file_paths)
+        self.lock = threading.Lock()
+        self.process = None
+        self.conn = None
+        self.finalizer = None
+
+    def start(self, deadline, timeout):
+        if self.process is not None and self.process.is_alive():
+            return
+        self.close()
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=serve, args=(self.file_paths, child_conn), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        # Kill the process when the worker is dropped, e.g. evicted by Streamlit
+        self.finalizer = weakref.finalize(self, stop, self.process, self.conn)
+        try:
+            if not self.conn.poll(max(deadline - time.monotonic(), 0)):
+                raise QueryTimeout(
+                    f"Query worker did not load the ontology within {timeout:g} seconds"
+                )
+            kind, payload = self.conn.recv()
+        except EOFError:
+            self.close()
+            raise QueryFailed("Query worker exited while loading the ontology")
+        except BaseException:
+            self.close()
+            raise
+        if kind == "error":
+            self.close()
+            raise QueryFailed(payload)
+
+    def close(self):
+        if self.finalizer is not None:
+            self.finalizer()
+        self.process = self.conn = self.finalizer = None
+
+    def execute(self, query, deadline, timeout, max_rows):
+        """Run a query before deadline (time.monotonic), timeout being its budget."""
+        self.start(deadline, timeout)
+        self.conn.send((query, max_rows))
+        rows = []
+        result_type = None
+        finished = False
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.conn.poll(remaining):
+                    raise QueryTimeout(
+                        f"Query did not finish within {timeout:g} seconds "
+                        f"({len(rows)} row(s) received)"
+                    )
+                try:
+                    kind, payload = self.conn.recv()
+                except EOFError:
+                    raise QueryFailed("Query worker exited unexpectedly")
+                if kind == "type":
+                    result_type = payload
+                elif kind == "rows":
+                    rows.extend(payload)
+                elif kind == "done":
+                    finished = True
+                    return QueryResult(rows, payload, result_type)
+                else:
+                    finished = True
+                    raise QueryFailed(payload)
+        finally:
+            # Still evaluating: timed out, or Streamlit stopped the run, which
+            # cancels the query
+            if not finished:
+                self.close()
+
+
+class QueryPool:
+    """Up to size QueryWorkers of the same ontology files, started as needed."""
+
+    def __init__(self, file_paths, size=POOL_SIZE):
+        self.workers = [QueryWorker(file_paths) for _ in range(size)]
+
+    def execute(self, query, timeout=QUERY_TIMEOUT, max_rows=MAX_ROWS):
+        """
+        Evaluate a SPARQL query and return a QueryResult with at most max_rows rows.
+
+        Raises QueryBusy when every worker is running another query,
+        QueryTimeout when loading a worker and the query take longer than
+        timeout seconds together and QueryFailed when rdflib rejects or fails
+        to evaluate it.
+        """
+        deadline = time.monotonic() + timeout
+        # Workers that already run are tried first, so the others are only
+        # started when queries overlap
+        for worker in sorted(self.workers, key=lambda worker: worker.process is None):
+            if worker.lock.acquire(blocking=False):
+                try:
+                    return worker.execute(query, deadline, timeout, max_rows)
+                finally:
+                    worker.lock.release()
+        raise QueryBusy(
+            f"All {len(self.workers)} query workers are running other queries"
+        )
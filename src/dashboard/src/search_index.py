@@ -0,0 +1,89 @@
+"""
+Inverted full-text index over the descriptions of the ontology.
+
+Descriptions are accent-folded with unidecode, lower-cased and tokenized once
+when the index is built. A query matches the entities whose description
+contains, for every query term, a token starting with that term (so "protec"
+finds "protection"), and results are ranked by tf-idf with exact token
+matches weighted above prefix matches.
+"""
+
+import bisect
+import math
+import re
+from collections import Counter
+
+from rdflib import Namespace
+from unidecode import unidecode
+
+ELI = Namespace("http://data.europa.eu/eli/ontology#")
+
+TOKEN_PATTERN = re.compile(r"\w+")
+PREFIX_MATCH_WEIGHT = 0.5
+
+
+def normalize(text):
+    return unidecode(text).lower()
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(normalize(text))
+
+
+class KeywordIndex:
+    def __init__(self, graph):
+        # One document per (subject, description, title_alternative), the rows
+        # the former SPARQL query of the Keyword Search section returned
+        self.documents = []
+        self.postings = {}
+        for subject, description in graph.subject_objects(ELI.description):
+            tokens = None
+            for title_alt in graph.objects(subject, ELI.title_alternative):
+                if tokens is None:
+                    tokens = Counter(tokenize(str(description)))
+                doc_id = len(self.documents)
+                self.documents.append((str(subject), str(description), str(title_alt)))
+                for token, count in tokens.items():
+                    self.postings.setdefault(token, {})[doc_id] = count
+        self.vocabulary = sorted(self.postings)
+
+    def __len__(self):
+        return len(self.documents)
+
+    def expand(self, term):
+        """Return the indexed tokens starting with term."""
+        start = bisect.bisect_left(self.vocabulary, term)
+        end = bisect.bisect_left(self.vocabulary, term + "\uffff", start)
+        return self.vocabulary[start:end]
+
+    def term_scores(self, term):
+        scores = {}
+        for token in self.expand(term):
+            postings = self.postings[token]
+            weight = math.log(1 + len(self.documents) / len(postings))
+            if token != term:
+                weight *= PREFIX_MATCH_WEIGHT
+            for doc_id, count in postings.items():
+                scores[doc_id] = scores.get(doc_id, 0) + count * weight
+        return scores
+
+    def search(self, query):
+        """
+        Return the (subject, description, title_alternative) documents matching
+        every term of the query, best match first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        per_term = sorted((self.term_scores(term) for term in terms), key=len)
+        scores = dict(per_term[0])
+        for term_scores in per_term[1:]:
+            scores = {
+                doc_id: score + term_scores[doc_id]
+                for doc_id, score in scores.items()
+                if doc_id in term_scores
+            }
+            if not scores:
+                return []
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [self.documents[doc_id] for doc_id, _ in ranked]
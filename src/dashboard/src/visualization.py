@@ -0,0 +1,198 @@
+"""
+Level-of-detail subgraphs of the ontology for the Visualization page.
+
+build_view() selects the structure edges (eli:is_realized_by, eli:has_part,
+eli:is_part_of and the links to gdpr:GDPR) of one locale. render_html() draws
+them with pyvis down to a detail level, articles by default. The deeper nodes
+are embedded in the page and only added to the network when a node above them
+is clicked, so the browser does not run physics on thousands of nodes at once.
+"""
+
+import json
+
+from pyvis.network import Network
+from rdflib import Namespace, URIRef
+
+ELI = Namespace("http://data.europa.eu/eli/ontology#")
+GDPR_ROOT = URIRef("http://example.org/gdpr#GDPR")
+
+PREDICATES = {
+    "is_realized_by": ELI.is_realized_by,
+    "has_part": ELI.has_part,
+    "is_part_of": ELI.is_part_of,
+}
+# Depth of a node, from the last component of its id (e.g. cpt_3.art_12 -> art)
+LEVELS = {"p": 1, "cpt": 2, "sct": 3, "art": 4, "pt": 5, "spt": 6, "sspt": 7}
+DETAIL_LEVELS = {"Chapter": 2, "Article": 4, "Point": 5, "Everything": 7}
+MAX_EDGES = 11000
+
+SUBJECT_COLOR = "#4CAF50"  # Green for classes
+OBJECT_COLOR = "#2196F3"  # Blue for individuals
+
+NETWORK_OPTIONS = """
+var options = {
+  "edges": {
+    "arrows": {
+      "to": {
+        "enabled": true
+      }
+    },
+    "color": {
+      "inherit": true
+    },
+    "smooth": false
+  },
+  "physics": {
+    "enabled": true,
+    "stabilization": {
+      "enabled": true,
+      "iterations": 200
+    }
+  }
+}
+"""
+
+# Adds the hidden neighbours of a clicked node (and the edges between shown
+# nodes) to the vis.js DataSets pyvis creates in the page
+EXPAND_SCRIPT = """
+<script type="text/javascript">
+  var hiddenNodes = %(hidden_nodes)s;
+  var hiddenEdges = %(hidden_edges)s;
+  var shownNodes = %(shown_nodes)s;
+  var hiddenAdjacency = {};
+  var addedEdges = {};
+  hiddenEdges.forEach(function (edge, i) {
+    (hiddenAdjacency[edge.from] = hiddenAdjacency[edge.from] || []).push(i);
+    (hiddenAdjacency[edge.to] = hiddenAdjacency[edge.to] || []).push(i);
+  });
+  function revealNode(id) {
+    if (shownNodes[id]) return;
+    shownNodes[id] = true;
+    nodes.add(hiddenNodes[id]);
+    (hiddenAdjacency[id] || []).forEach(function (i) {
+      var edge = hiddenEdges[i];
+      if (!addedEdges[i] && shownNodes[edge.from] && shownNodes[edge.to]) {
+        addedEdges[i] = true;
+        edges.add(edge);
+      }
+    });
+  }
+  network.on("click", function (params) {
+    if (params.nodes.length !== 1) return;
+    var id = params.nodes[0];
+    (hiddenAdjacency[id] || []).forEach(function (i) {
+      var edge = hiddenEdges[i];
+      revealNode(edge.from === id ? edge.to : edge.from);
+    });
+  });
+</script>
+"""
+
+
+def node_level_and_locale(uri):
+    """
+    Return (depth, locale) of a node: locale is "" for the EU abstract layer,
+    e.g. "eu_pt" or "pt" for concrete nodes and "abstract_pt" for the abstract
+    layer of a national implementation.
+    """
+    parts = str(uri).split("#")[-1].split(".")[-1].split("_")
+    if parts[0] == "gdpr":
+        return 0, "_".join(parts[1:])
+    if parts[0] in LEVELS and len(parts) > 1:
+        return LEVELS[parts[0]], "_".join(parts[2:])
+    return 0, ""
+
+
+def view_locales(graph):
+    """The locales of the concrete layers, for the locale filter."""
+    return sorted(
+        {node_level_and_locale(o)[1] for o in graph.objects(None, ELI.is_realized_by)}
+        - {""}
+    )
+
+
+def build_view(graph, predicate_names, locale=None):
+    """
+    Return (nodes, edges) of the structure subgraph: nodes maps each node label to
+    (uri, color, level) and edges are (from label, to label, predicate name).
+    With a locale, only that locale and the abstract layer it realizes are kept.
+    """
+    allowed = None
+    if locale and locale.startswith("eu_"):
+        allowed = {locale, ""}
+    elif locale:
+        allowed = {locale, f"abstract_{locale}"}
+
+    triples = set()
+    for name in predicate_names:
+        for s, o in graph.subject_objects(PREDICATES[name]):
+            triples.add((s, name, o))
+    for s, p in graph.subject_predicates(GDPR_ROOT):
+        triples.add((s, str(p).split("#")[-1], GDPR_ROOT))
+
+    nodes = {}
+    edges = []
+    for s, name, o in sorted(triples):
+        if allowed is not None and (
+            node_level_and_locale(s)[1] not in allowed
+            or node_level_and_locale(o)[1] not in allowed
+        ):
+            continue
+        subj_label = str(s).split("/")[-1]
+        obj_label = str(o).split("/")[-1]
+        if subj_label not in nodes:
+            nodes[subj_label] = (str(s), SUBJECT_COLOR, node_level_and_locale(s)[0])
+        if obj_label not in nodes:
+            nodes[obj_label] = (str(o), OBJECT_COLOR, node_level_and_locale(o)[0])
+        edges.append((subj_label, obj_label, name))
+        if len(edges) >= MAX_EDGES:
+            break
+    return nodes, edges
+
+
+def to_json(value):
+    # Keep the embedded data from closing the surrounding <script> element
+    return json.dumps(value).replace("</", "<\\/")
+
+
+def render_html(nodes, edges, detail_level):
+    """
+    Return (html, shown node count) of the interactive network showing the nodes
+    down to detail_level (see LEVELS), the rest being revealed on click.
+    """
+    node_data = {
+        label: {
+            "color": color,
+            "title": uri,
+            "id": label,
+            "label": label,
+            "shape": "dot",
+        }
+        for label, (uri, color, level) in nodes.items()
+    }
+    shown = {label for label, (_, _, level) in nodes.items() if level <= detail_level}
+    edge_data = [
+        {"label": name, "from": frm, "to": to, "arrows": "to"}
+        for frm, to, name in edges
+    ]
+
+    net = Network(height="750px", width="100%", directed=True)
+    # Filled directly: add_node/add_edge scan every known node on each call
+    net.node_ids = [label for label in node_data if label in shown]
+    net.node_map = {label: node_data[label] for label in net.node_ids}
+    net.nodes = list(net.node_map.values())
+    net.edges = [e for e in edge_data if e["from"] in shown and e["to"] in shown]
+    net.set_options(NETWORK_OPTIONS)
+    # Generated in memory: concurrent sessions used to race on one graph.html
+    html = net.generate_html()
+
+    script = EXPAND_SCRIPT % {
+        "hidden_nodes": to_json(
+            {label: data for label, data in node_data.items() if label not in shown}
+        ),
+        "hidden_edges": to_json(
+            [e for e in edge_data if e["from"] not in shown or e["to"] not in shown]
+        ),
+        "shown_nodes": to_json({label: True for label in shown}),
+    }
+    return html.replace("</body>", script + "</body>", 1), len(shown)
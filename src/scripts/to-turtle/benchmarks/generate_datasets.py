@@ -0,0 +1,227 @@
+"""
+Generate large, deterministic synthetic datasets in the gdpr-*.json schema.
+
+The EU regulation keeps the structure of gdpr-eu-en.json (so relatedArticles and
+handlers/eu_articles.json stay valid) and is emitted once per EU locale with
+pseudo-words in place of the text. Every fake member state gets a national law
+shaped like gdpr-de.json (PART > CHAPTER > ...) or gdpr-pt.json (CHAPTER > ...),
+optionally replicated --national-scale times, with re-sampled relatedArticles.
+A locales.json for to-turtle/main.py --config is written next to the datasets.
+
+Run from the repository root:
+    python src/scripts/to-turtle/benchmarks/generate_datasets.py \\
+        --member-states 27 --locales 24 --out /tmp/gdpr-synthetic
+    python src/scripts/to-turtle/main.py --config /tmp/gdpr-synthetic/locales.json \\
+        --datasets-dir /tmp/gdpr-synthetic --output-dir /tmp/gdpr-synthetic/rdfs
+    GDPR_ONTOLOGY_FILE=/tmp/gdpr-synthetic/rdfs/abstract.ttl \\
+        streamlit run src/dashboard/src/dashboard.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "handlers"))
+from util import load_eu_article_index
+
+EU_LANGUAGES = [
+    "en", "pt", "it", "de", "bg", "cs", "da", "el", "es", "et", "fi", "fr",
+    "ga", "hr", "hu", "lt", "lv", "mt", "nl", "pl", "ro", "sk", "sl", "sv",
+]  # fmt: skip
+MEMBER_STATES = [
+    "de", "pt", "at", "be", "bg", "cy", "cz", "dk", "ee", "es", "fi", "fr",
+    "gr", "hr", "hu", "ie", "it", "lt", "lu", "lv", "mt", "nl", "pl", "ro",
+    "se", "si", "sk",
+]  # fmt: skip
+
+WORD_PATTERN = re.compile(r"[^\W\d_]+")
+ROMAN_PATTERN = re.compile(r"[IVXLCDM]+")
+CONSONANTS = "bcdfghklmnprstvz"
+VOWELS = "aeiou"
+
+
+def codes(known: list[str], count: int, prefix: str):
+    """The first count known codes, then made-up ones once those run out."""
+    return known[:count] + [f"{prefix}{i:03d}" for i in range(len(known), count)]
+
+
+def rename_subtree(node, old_root: str, new_root: str):
+    """Copy a node, moving every key under old_root to new_root."""
+    if not isinstance(node, dict):
+        return node
+    content = node["content"]
+    if isinstance(content, dict):
+        content = {
+            (
+                new_root + key[len(old_root) :]
+                if key == old_root or key.startswith(old_root + ".")
+                else key
+            ): rename_subtree(child, old_root, new_root)
+            for key, child in content.items()
+        }
+    return {**node, "content": content}
+
+
+def scale_dataset(data: dict, scale: int):
+    """Replicate the top-level nodes of a dataset scale times."""
+    if scale <= 1:
+        return data
+    scaled = dict(data)
+    count = len(data)
+    for copy in range(1, scale):
+        for index, (key, node) in enumerate(data.items()):
+            prefix = key.rsplit("_", 1)[0]
+            new_key = f"{prefix}_{copy * count + index + 1}"
+            scaled[new_key] = rename_subtree(node, key, new_key)
+    return scaled
+
+
+class FakeLanguage:
+    """Maps every word to a stable pseudo-word of the same length and case."""
+
+    def __init__(self, seed: int, name: str):
+        self.salt = f"{seed}:{name}:".encode("utf-8")
+        self.words = {}
+
+    def word(self, word: str):
+        # Keep roman numerals, headings like "CHAPTER IV" are parsed for them
+        if ROMAN_PATTERN.fullmatch(word):
+            return word
+        fake = self.words.get(word)
+        if fake is None:
+            rng = random.Random(
+                hashlib.blake2b(self.salt + word.encode("utf-8")).digest()
+            )
+            letters = [
+                rng.choice(VOWELS if i % 2 else CONSONANTS) for i in range(len(word))
+            ]
+            fake = "".join(
+                l.upper() if c.isupper() else l for l, c in zip(letters, word)
+            )
+            self.words[word] = fake
+        return fake
+
+    def text(self, text: str):
+        return WORD_PATTERN.sub(lambda m: self.word(m.group(0)), text)
+
+    def translate(self, value):
+        """Translate every string of a dataset node, keeping keys and classTypes."""
+        if isinstance(value, str):
+            return self.text(value)
+        if isinstance(value, list):
+            # SUBPOINT contents are ["a)", "text"]; keep the label untouched
+            return [value[0]] + [self.translate(v) for v in value[1:]]
+        if isinstance(value, dict):
+            return {
+                key: (
+                    child
+                    if key in ("classType", "relatedArticles")
+                    else self.translate(child)
+                )
+                for key, child in value.items()
+            }
+        return value
+
+
+def resample_related_articles(value, rng: random.Random, articles: list[str]):
+    if isinstance(value, dict):
+        if "relatedArticles" in value:
+            count = min(len(value["relatedArticles"]), len(articles))
+            value["relatedArticles"] = sorted(rng.sample(articles, count), key=int)
+        for child in value.values():
+            resample_related_articles(child, rng, articles)
+
+
+def write_json(path: str, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def generate(
+    out_dir: str,
+    datasets_dir: str,
+    locales: int,
+    member_states: int,
+    national_scale: int,
+    seed: int,
+):
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(datasets_dir, "gdpr-eu-en.json"), "r") as f:
+        eu_template = json.load(f)
+    national_templates = []
+    for file_name in ("gdpr-de.json", "gdpr-pt.json"):
+        with open(os.path.join(datasets_dir, file_name), "r") as f:
+            national_templates.append(json.load(f))
+    articles = sorted(load_eu_article_index(), key=int)
+
+    config = {"eu": {}, "national": {}}
+    for language in codes(EU_LANGUAGES, locales, "l"):
+        fake = FakeLanguage(seed, f"eu_{language}")
+        locale = f"eu_{language}"
+        config["eu"][locale] = (
+            fake.text("Regulation of the European Union") + f" ({locale})"
+        )
+        write_json(
+            os.path.join(out_dir, f"gdpr-eu-{language}.json"),
+            fake.translate(eu_template),
+        )
+
+    for index, country in enumerate(codes(MEMBER_STATES, member_states, "m")):
+        rng = random.Random(f"{seed}:{country}")
+        fake = FakeLanguage(seed, country)
+        template = national_templates[index % len(national_templates)]
+        data = fake.translate(scale_dataset(template, national_scale))
+        resample_related_articles(data, rng, articles)
+        config["national"][country] = (
+            fake.text("National data protection act") + f" ({country})"
+        )
+        write_json(os.path.join(out_dir, f"gdpr-{country}.json"), data)
+
+    write_json(os.path.join(out_dir, "locales.json"), config)
+    return config
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic GDPR datasets")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--locales", type=int, default=4, help="number of EU locales")
+    parser.add_argument(
+        "--member-states",
+        type=int,
+        default=2,
+        help="number of national implementations",
+    )
+    parser.add_argument(
+        "--national-scale",
+        type=int,
+        default=1,
+        help="replicate each national law's top-level parts/chapters this many times",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--datasets-dir",
+        default="src/datasets",
+        help="directory with the real datasets used as templates",
+    )
+    args = parser.parse_args()
+
+    config = generate(
+        os.path.abspath(args.out),
+        os.path.abspath(args.datasets_dir),
+        args.locales,
+        args.member_states,
+        args.national_scale,
+        args.seed,
+    )
+    print(
+        f"Wrote {len(config['eu'])} EU locale(s) and "
+        f"{len(config['national'])} member state(s) to {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark of the to-turtle build pipeline, stage by stage.
+
+Times JSON loading, every build unit (EU abstract layer, EU concrete layer per
+locale, national abstract and concrete layers per member state) and the final
+serialization, reporting triples/second and the peak RSS after each stage.
+--scale N replicates the top-level chapters/parts of every dataset N times
+(with renumbered keys, identical across locales) to see how the build scales.
+
+Run from the repository root:
+    python src/scripts/to-turtle/benchmarks/pipeline_bench.py --scale 10
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import rdflib
+import main
+from sink import NTriplesSink
+from generate_datasets import scale_dataset
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def layer_of(unit_name: str):
+    if unit_name == "schema":
+        return "schema"
+    if unit_name == "eu_abstract":
+        return "EU abstract"
+    if unit_name in main.locales:
+        return "EU concrete"
+    if unit_name.startswith("abstract_"):
+        return "national abstract"
+    return "national concrete"
+
+
+class Report:
+    def __init__(self):
+        self.rows = []
+
+    def add(self, stage, layer, seconds, triples=None):
+        self.rows.append((stage, layer, seconds, triples, peak_rss_mb()))
+
+    def print(self):
+        print(
+            f"{'stage':<24}{'layer':<20}{'time (s)':>10}"
+            f"{'triples':>10}{'triples/s':>12}{'peak RSS (MB)':>15}"
+        )
+        for stage, layer, seconds, triples, rss in self.rows:
+            rate = f"{triples / seconds:,.0f}" if triples and seconds else ""
+            count = f"{triples:,}" if triples is not None else ""
+            print(
+                f"{stage:<24}{layer:<20}{seconds:>10.3f}"
+                f"{count:>10}{rate:>12}{rss:>15.1f}"
+            )
+
+
+def run(scale: int, output: str):
+    report = Report()
+    units = main.build_units()
+
+    datasets = {}
+    for name, file_name, _ in units:
+        if file_name is None or file_name in datasets:
+            continue
+        start = time.perf_counter()
+        with open(main.dataset_path(file_name), "r") as f:
+            datasets[file_name] = scale_dataset(json.load(f), scale)
+        report.add(f"load {file_name}", "json", time.perf_counter() - start)
+
+    if output == "nt":
+        # Stream to /dev/null so the RSS reflects the sink, not the output
+        out = open(os.devnull, "w", encoding="utf-8")
+        graph = NTriplesSink(out)
+    else:
+        graph = rdflib.Graph()
+        main.bind_namespaces(graph)
+
+    total_start = time.perf_counter()
+    for name, file_name, fn in units:
+        main.begin_unit(graph, name)
+        before = len(graph)
+        start = time.perf_counter()
+        if file_name is None:
+            fn(graph)
+        else:
+            fn(graph, datasets[file_name])
+        report.add(
+            f"build {name}",
+            layer_of(name),
+            time.perf_counter() - start,
+            len(graph) - before,
+        )
+    build_seconds = time.perf_counter() - total_start
+    report.add("build (all units)", "total", build_seconds, len(graph))
+
+    if output == "turtle":
+        start = time.perf_counter()
+        graph.serialize(format="turtle", encoding="utf-8")
+        report.add("serialize turtle", "output", time.perf_counter() - start)
+    else:
+        out.close()
+
+    report.print()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the to-turtle build")
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="replicate every dataset's top-level nodes this many times",
+    )
+    parser.add_argument(
+        "--output",
+        choices=["turtle", "nt"],
+        default="turtle",
+        help="build into an rdflib Graph and serialize it, or stream N-Triples",
+    )
+    parser.add_argument(
+        "--datasets-dir",
+        default=main.DEFAULT_DATASETS_DIR,
+        help="directory with the gdpr-*.json datasets, e.g. generate_datasets.py output",
+    )
+    parser.add_argument(
+        "--config",
+        default=main.DEFAULT_CONFIG,
+        help="locale configuration matching --datasets-dir",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    main.configure(args.config, args.datasets_dir)
+    run(args.scale, args.output)
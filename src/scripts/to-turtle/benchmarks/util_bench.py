@@ -0,0 +1,110 @@
+"""
+Micro-benchmark of the per-node id helpers in handlers/util.py.
+
+Replays, for every node of every dataset, the id work the build does per node
+(is the node a repeated introductory point, and its number): once with the
+former helpers (uncompiled patterns, URI re-parsing per call) and once with the
+compiled patterns and memoized parse_node_id. Both sides answer the same two
+questions for every node. The parse_node_id cache is cleared before every
+"after" pass, as at the start of a build; the warm figure shows what a key
+parsed again later in the build costs.
+
+Run from the repository root:
+    python src/scripts/to-turtle/benchmarks/util_bench.py
+"""
+
+import json
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "handlers"))
+from util import extract_all_numbers, parse_node_id
+
+DATASETS = {
+    "eu_en": "gdpr-eu-en.json",
+    "eu_pt": "gdpr-eu-pt.json",
+    "eu_it": "gdpr-eu-it.json",
+    "eu_de": "gdpr-eu-de.json",
+    "de": "gdpr-de.json",
+    "pt": "gdpr-pt.json",
+}
+RGDPR = "http://example.org/rgdpr#"
+
+
+# Helpers as they were before the compiled/memoized versions
+
+
+def legacy_extract_all_numbers(text):
+    return "".join(re.findall(r"\d+", text)).strip()
+
+
+def legacy_extract_node_id(node_uri: str, locale: str = ""):
+    return re.sub(rf"_{locale}$", "", node_uri.split("#")[-1])
+
+
+def legacy_extract_number_from_id(node_id: str, locale: str = ""):
+    return legacy_extract_node_id(node_id, locale).split("_").pop()
+
+
+def collect_nodes(datasets_dir: str):
+    """Return (key, node uri, locale, content) for every structural node."""
+    nodes = []
+
+    def collect(key, node, locale):
+        if node["classType"] in ("TITLE", "TITLE_ID"):
+            return
+        nodes.append((key, RGDPR + key + "_" + locale, locale, node["content"]))
+        if isinstance(node["content"], dict):
+            for child_key, child in node["content"].items():
+                collect(child_key, child, locale)
+
+    for locale, file_name in DATASETS.items():
+        with open(os.path.join(datasets_dir, file_name), "r") as f:
+            for key, node in json.load(f).items():
+                collect(key, node, locale)
+    return nodes
+
+
+def legacy_per_node(nodes):
+    for key, node_uri, locale, content in nodes:
+        last_key_cmp = node_uri.split(".")[-2:]
+        if (
+            len(last_key_cmp) == 2
+            and (last_key_cmp[0] + "_" + locale) == last_key_cmp[1]
+        ):
+            continue
+        if isinstance(content, str):
+            legacy_extract_all_numbers(content[0:5]) or legacy_extract_number_from_id(
+                node_uri, locale
+            )
+
+
+def current_per_node(nodes):
+    for key, node_uri, locale, content in nodes:
+        node_id = parse_node_id(key)
+        if node_id.repeated:
+            continue
+        if isinstance(content, str):
+            extract_all_numbers(content[0:5]) or node_id.number
+
+
+def main():
+    nodes = collect_nodes(os.path.abspath("src/datasets"))
+    runs = (
+        ("before", legacy_per_node, "pass"),
+        ("after (cold cache)", current_per_node, parse_node_id.cache_clear),
+        ("after (warm cache)", current_per_node, lambda: current_per_node(nodes)),
+    )
+    for name, fn, setup in runs:
+        # number=1 so the setup (clearing or warming the cache) precedes every pass
+        best = min(timeit.repeat(lambda: fn(nodes), setup=setup, number=1, repeat=25))
+        print(
+            f"{name:>18}: {best * 1000:8.2f} ms per pass, "
+            f"{best / len(nodes) * 1e9:7.0f} ns per node ({len(nodes)} nodes)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Before/after benchmark of the table-driven walker (handlers/walker.py) against
+the recursive handle_*.py modules it replaced.
+
+The build code of --baseline (by default the last commit that still has
+handlers/handle_chapter.py) is extracted with git archive into a temporary
+directory. Each run of a tree builds every unit into an rdflib Graph in a
+fresh process, with the datasets already loaded, so its caches start cold as
+in a real build. Runs of the two trees alternate, so both see the same load
+on the machine, and are timed in CPU time of the process. The best of
+--repeat runs is reported per layer, with the triple count of each side so
+both are known to do the same work.
+
+Run from the repository root:
+    python src/scripts/to-turtle/benchmarks/walker_bench.py --repeat 7
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BUILD_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# Removed along with the other handle_*.py modules when the walker replaced them
+FORMER_HANDLER = os.path.join("handlers", "handle_chapter.py")
+
+
+def layer_of(unit_name: str, locales):
+    if unit_name in ("schema", "eu_abstract"):
+        return unit_name
+    if unit_name in locales:
+        return "eu"
+    if unit_name.startswith("abstract_"):
+        return "national_abstract"
+    return "national"
+
+
+def measure(build_dir: str):
+    """Runs in the child process: time every layer of one build in build_dir."""
+    sys.path.insert(0, build_dir)
+    import rdflib
+    import main
+
+    units = main.build_units()
+    datasets = {
+        file_name: main.load_dataset(file_name)
+        for _, file_name, _ in units
+        if file_name is not None
+    }
+    graph = rdflib.Graph()
+    main.bind_namespaces(graph)
+    seconds = {}
+    for name, file_name, fn in units:
+        start = time.process_time()
+        if file_name is None:
+            fn(graph)
+        else:
+            fn(graph, datasets[file_name])
+        layer = layer_of(name, main.locales)
+        seconds[layer] = seconds.get(layer, 0) + time.process_time() - start
+    seconds["total"] = sum(seconds.values())
+    return {"seconds": seconds, "triples": len(graph)}
+
+
+def run_tree(build_dir: str):
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", build_dir],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def run_trees(build_dirs, repeat: int):
+    """Best seconds per layer and triple count of each tree, runs alternating."""
+    results = [{"seconds": {}, "triples": None} for _ in build_dirs]
+    for _ in range(repeat):
+        for build_dir, result in zip(build_dirs, results):
+            run = run_tree(build_dir)
+            best = result["seconds"]
+            for layer, value in run["seconds"].items():
+                best[layer] = min(best.get(layer, value), value)
+            result["triples"] = run["triples"]
+    return results
+
+
+def git(*args, **kwargs):
+    return subprocess.run(
+        ["git", *args], cwd=BUILD_DIR, check=True, capture_output=True, **kwargs
+    ).stdout
+
+
+def find_baseline():
+    """The last commit whose build still had the handle_*.py modules."""
+    removal = git(
+        "log", "-1", "--diff-filter=D", "--format=%H", "--",
+        os.path.join(BUILD_DIR, FORMER_HANDLER), text=True,
+    ).strip()
+    if not removal:
+        raise SystemExit(f"No commit removes {FORMER_HANDLER}, pass --baseline")
+    return removal + "^"
+
+
+def extract_baseline(revision: str, directory: str):
+    repo = git("rev-parse", "--show-toplevel", text=True).strip()
+    prefix = os.path.relpath(BUILD_DIR, repo)
+    archive = subprocess.run(
+        ["git", "archive", revision, prefix],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    ).stdout
+    subprocess.run(["tar", "-x", "-C", directory], input=archive, check=True)
+    return os.path.join(directory, prefix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the walker against the former handlers")
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="git revision of the former handlers (default: the last commit with "
+        f"{FORMER_HANDLER})",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per tree, the best is reported")
+    parser.add_argument("--measure", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure)))
+        return
+
+    baseline = args.baseline or find_baseline()
+    print(f"baseline: {baseline}")
+    with tempfile.TemporaryDirectory() as directory:
+        before, after = run_trees(
+            [extract_baseline(baseline, directory), BUILD_DIR], args.repeat
+        )
+
+    print(f"{'layer':<20}{'before (s)':>12}{'after (s)':>12}{'speedup':>10}")
+    for layer, seconds in after["seconds"].items():
+        previous = before["seconds"].get(layer)
+        print(f"{layer:<20}{previous:>12.3f}{seconds:>12.3f}{previous / seconds:>9.2f}x")
+    print(f"triples: before {before['triples']:,}, after {after['triples']:,}")
+
+
+if __name__ == "__main__":
+    main()
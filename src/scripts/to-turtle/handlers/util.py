@@ -1,63 +1,89 @@
+import json
+import os
 import re
-from rdflib import URIRef, Literal, Namespace
+from collections import namedtuple
+from functools import lru_cache
 
+EU_ARTICLES_PATH = os.path.join(os.path.dirname(__file__), "eu_articles.json")
 
-def add_description(
-    graph,
-    node,
-    node_uri: URIRef,
-    parent_uri: URIRef,
-    locale: str,
-    custom_namespaces: dict[str, Namespace],
-):
-    graph.add(
-        (node_uri, custom_namespaces["ELI"].description, Literal(node["content"]))
-    )
-    # get the number from the beginning of the string using regex
-    number = (
-        extract_all_numbers(node["content"][0:5])
-        if "content" in node and isinstance(node["content"], str)
-        else None
-    )
-
-    number = number if number else extract_number_from_id(node_uri, locale)
-    graph.add((node_uri, custom_namespaces["ELI"].number, Literal(number)))
-    for parent_title_alternative in graph.objects(
-        parent_uri, custom_namespaces["ELI"].title_alternative
-    ):
-        graph.add(
-            (
-                node_uri,
-                custom_namespaces["ELI"].title_alternative,
-                Literal(parent_title_alternative + "-" + number),
-            )
-        )
+
+NUMBERS_PATTERN = re.compile(r"\d+")
+ROMANS_PATTERN = re.compile(r" [IVXLCDM0-9]+")
+
+# Prefix of each id component, e.g. "p_1.cpt_2.sct_1.art_12.pt_3.spt_a"
+NODE_ID_COMPONENTS = {
+    "p": "part",
+    "cpt": "chapter",
+    "sct": "section",
+    "art": "article",
+    "pt": "point",
+    "spt": "subpoint",
+    "sspt": "subsubpoint",
+}
+
+# number: what follows the last "_" of the id; repeated: the last component
+# repeats the previous one (e.g. "cpt_1.art_2.pt_2.pt_2")
+NodeId = namedtuple(
+    "NodeId", list(NODE_ID_COMPONENTS.values()) + ["number", "repeated"]
+)
+NODE_ID_FIELD_INDEX = {prefix: i for i, prefix in enumerate(NODE_ID_COMPONENTS)}
 
 
 def extract_all_numbers(text):
     # Find all sequences of digits in the text
-    numbers = re.findall(r"\d+", text)
+    numbers = NUMBERS_PATTERN.findall(text)
     # Convert them to integers
     return "".join(numbers).strip()
 
 
 def extract_romans(text):
     # Find all sequences of roman numerals in the text
-    romans = re.findall(r" [IVXLCDM0-9]+", text)
+    romans = ROMANS_PATTERN.findall(text)
     # Convert them to integers
     return "".join(romans).strip()
 
 
-def extract_node_id(node_uri: str, locale: str = ""):
-    # exclude the locale
-    return re.sub(rf"_{locale}$", "", node_uri.split("#")[-1])
-
-
-def extract_number_from_id(node_id: str, locale: str = ""):
-    return extract_node_id(node_id, locale).split("_").pop()
-
-
-# print(extract_number_from_id("cpt_1.art_4.pt_1_eu_de", "eu_de"))
+@lru_cache(maxsize=1 << 16)
+def parse_node_id(node_id: str):
+    """
+    Split a dataset key into its structural components,
+    e.g. "cpt_3.sct_2.art_13.pt_1" -> NodeId(chapter="3", section="2", ...)
+    """
+    fields = [None] * len(NodeId._fields)
+    components = node_id.split(".")
+    for component in components:
+        prefix, _, value = component.rpartition("_")
+        index = NODE_ID_FIELD_INDEX.get(prefix)
+        if index is not None:
+            fields[index] = value
+    fields[-2] = node_id.rpartition("_")[2]
+    fields[-1] = len(components) > 1 and components[-1] == components[-2]
+    return NodeId._make(fields)
+
+
+@lru_cache(maxsize=None)
+def load_eu_article_index():
+    """
+    Load eu_articles.json once and index it by article number,
+    e.g. {"1": "cpt_1.art_1", "13": "cpt_3.sct_2.art_13"}
+    """
+    with open(EU_ARTICLES_PATH, "r") as json_file:
+        eu_articles = json.load(json_file)
+
+    index = {}
+    for article_id in eu_articles:
+        index.setdefault(parse_node_id(article_id).article, article_id)
+    return index
+
+
+def find_eu_article(number: str):
+    # exact match on the art_N component, so "1" never resolves to art_10
+    try:
+        return load_eu_article_index()[str(number).strip()]
+    except KeyError:
+        raise ValueError(
+            f"Related article {number} does not exist in {EU_ARTICLES_PATH}"
+        ) from None
 
 
 def deep_extract_literal(
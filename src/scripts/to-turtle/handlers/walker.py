@@ -0,0 +1,351 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(__file__))
+from collections import namedtuple
+from functools import lru_cache
+from rdflib import URIRef, Literal, Namespace
+from rdflib.namespace import RDF
+from util import (
+    EU_ARTICLES_PATH,
+    extract_all_numbers,
+    extract_romans,
+    deep_extract_literal,
+    find_eu_article,
+    parse_node_id,
+)
+
+# emit(ctx, key, node, node_uri, parent_uri) adds the triples of the node itself.
+# children maps a child classType to VISIT (walk into it as a structural node)
+# or to a function(ctx, key, child, node_uri, parent_uri) adding triples to the
+# current node. skip_repeated skips nodes whose key repeats its last component
+# (e.g. "cpt_1.art_2.pt_2.pt_2"), which hold the introductory text of a point.
+Rule = namedtuple("Rule", ["emit", "children", "skip_repeated"])
+
+VISIT = "visit"
+
+
+@lru_cache(maxsize=None)
+def uri(value: str):
+    # A node URI is built again by the other units as a translation or
+    # counterpart; validating it once per process is enough
+    return URIRef(value)
+
+
+class WalkContext:
+    """
+    Everything the rules need to know about the layer being built:
+    how node URIs are formed, which layer they are linked to and in which locale.
+    """
+
+    def __init__(
+        self,
+        graph,
+        layer: str,
+        custom_namespaces: dict[str, Namespace],
+        locale: str = "",
+        locales: list[str] = (),
+    ):
+        self.graph = graph
+        self.layer = layer
+        self.rules = LAYERS[layer]
+        self.locale = locale
+        self.RGDPR = custom_namespaces["RGDPR"]
+        self.GDPR = custom_namespaces["GDPR"]
+        self.ELI = custom_namespaces["ELI"]
+        self.translations = []
+        self.language = None
+        # abstract layers also link every structural child with eli:has_part
+        self.link_children = layer.endswith("abstract")
+        # eli:title_alternative values added so far, so children can derive theirs
+        self.title_alternatives = {}
+
+        if layer == "eu":
+            self.node_ns, self.node_suffix = self.RGDPR, "_" + locale
+            self.counterpart_predicate = self.ELI.realizes
+            self.counterparts = [(self.GDPR, "")]
+            self.translations = [l for l in locales if l != locale]
+            self.language = Literal(locale.split("_")[1])
+        elif layer == "eu_abstract":
+            self.node_ns, self.node_suffix = self.GDPR, ""
+            self.counterpart_predicate = self.ELI.is_realized_by
+            self.counterparts = [(self.RGDPR, "_" + l) for l in locales]
+        elif layer == "national":
+            self.node_ns, self.node_suffix = self.RGDPR, "_" + locale
+            self.counterpart_predicate = self.ELI.realizes
+            self.counterparts = [(self.GDPR, "_abstract_" + locale)]
+            self.language = Literal(locale)
+        elif layer == "national_abstract":
+            self.node_ns, self.node_suffix = self.GDPR, "_abstract_" + locale
+            self.counterpart_predicate = self.ELI.is_realized_by
+            self.counterparts = [(self.RGDPR, "_" + locale)]
+        else:
+            raise ValueError(f"Unknown layer {layer}")
+
+    def node_uri(self, key: str):
+        return uri(self.node_ns + key + self.node_suffix)
+
+    def add(self, s, p, o):
+        self.graph.add((s, p, o))
+
+    def add_title_alternative(self, node_uri, value):
+        self.add(node_uri, self.ELI.title_alternative, value)
+        values = self.title_alternatives.setdefault(node_uri, [])
+        if value not in values:
+            values.append(value)
+
+
+def class_type_of(key: str, node, parent_key: str = None):
+    """The classType of a dataset node, or a ValueError naming the node."""
+    if isinstance(node, dict) and "classType" in node:
+        return node["classType"]
+    where = f" (in {parent_key!r})" if parent_key else ""
+    raise ValueError(
+        f"Dataset node {key!r}{where} has no classType: {str(node)[:80]}"
+    )
+
+
+def walk(ctx: WalkContext, key: str, node, parent_uri: URIRef = None):
+    """
+    Walk a node and all of its descendants depth-first with an explicit stack,
+    producing the same triples, in the same order, as a recursive descent.
+    """
+    stack = []
+
+    def enter(key, node, parent_uri):
+        rule = ctx.rules.get(class_type_of(key, node))
+        if rule is None:
+            return
+        if rule.skip_repeated and parse_node_id(key).repeated:
+            return
+        node_uri = ctx.node_uri(key)
+        rule.emit(ctx, key, node, node_uri, parent_uri)
+        if isinstance(node["content"], dict):
+            stack.append(
+                (key, node_uri, parent_uri, rule, iter(node["content"].items()))
+            )
+
+    enter(key, node, parent_uri)
+    while stack:
+        key, node_uri, parent_uri, rule, children = stack[-1]
+        child_key, child = next(children, (None, None))
+        if child is None:
+            stack.pop()
+            continue
+
+        action = rule.children.get(class_type_of(child_key, child, key))
+        if action is None:
+            continue
+        if action == VISIT:
+            if ctx.link_children:
+                # even children that end up skipped are linked
+                ctx.add(node_uri, ctx.ELI.has_part, ctx.node_uri(child_key))
+            enter(child_key, child, node_uri)
+        else:
+            action(ctx, key, child, node_uri, parent_uri)
+
+
+# Node triples
+
+
+def link_counterparts(ctx, key, node_uri):
+    for namespace, suffix in ctx.counterparts:
+        ctx.add(node_uri, ctx.counterpart_predicate, uri(namespace + key + suffix))
+
+
+def add_translations(ctx, key, node_uri):
+    for l in ctx.translations:
+        node_translated_uri = uri(ctx.RGDPR + key + "_" + l)
+        ctx.add(node_uri, ctx.ELI.is_translation_of, node_translated_uri)
+        ctx.add(node_uri, ctx.ELI.has_translation, node_translated_uri)
+
+
+def add_expression(ctx, key, node, node_uri, parent_uri):
+    ctx.add(node_uri, RDF.type, ctx.ELI.LegalExpression)
+    link_counterparts(ctx, key, node_uri)
+    add_translations(ctx, key, node_uri)
+
+
+def add_top_expression(ctx, key, node, node_uri, parent_uri):
+    add_expression(ctx, key, node, node_uri, parent_uri)
+    ctx.add(node_uri, ctx.ELI.language, ctx.language)
+
+
+def add_related_articles(ctx, key, node, node_uri, parent_uri):
+    add_expression(ctx, key, node, node_uri, parent_uri)
+    for related_article in node.get("relatedArticles", ()):
+        related_article_uri = URIRef(
+            ctx.RGDPR + find_eu_article(related_article) + "_eu_en"
+        )
+        ctx.add(node_uri, ctx.ELI.ensures_implementation_of, related_article_uri)
+        ctx.add(related_article_uri, ctx.ELI.implementation_ensured_by, node_uri)
+
+
+def add_point(ctx, key, node, node_uri, parent_uri):
+    add_expression(ctx, key, node, node_uri, parent_uri)
+    if isinstance(node["content"], str):
+        add_description(ctx, key, node, node_uri, parent_uri)
+
+
+def add_subpoint(ctx, key, node, node_uri, parent_uri):
+    add_expression(ctx, key, node, node_uri, parent_uri)
+    ctx.add(node_uri, ctx.ELI.description, Literal(node["content"][1]))
+    for parent_title_alternative in list(ctx.title_alternatives.get(parent_uri, ())):
+        ctx.add_title_alternative(
+            node_uri, Literal(f"{parent_title_alternative}-{node['content'][0]}")
+        )
+
+
+def add_national_subpoint(ctx, key, node, node_uri, parent_uri):
+    add_expression(ctx, key, node, node_uri, parent_uri)
+    if isinstance(node["content"], list):
+        ctx.add(node_uri, ctx.ELI.description, Literal(node["content"][1]))
+    elif isinstance(node["content"], str):
+        add_description(ctx, key, node, node_uri, parent_uri)
+
+
+def add_national_subsubpoint(ctx, key, node, node_uri, parent_uri):
+    add_expression(ctx, key, node, node_uri, parent_uri)
+    add_description(ctx, key, node, node_uri, parent_uri)
+
+
+def abstract_node(class_name: str):
+    def add_abstract_node(ctx, key, node, node_uri, parent_uri):
+        ctx.add(node_uri, RDF.type, ctx.GDPR[class_name])
+        if parent_uri:
+            ctx.add(node_uri, ctx.ELI.is_part_of, parent_uri)
+        link_counterparts(ctx, key, node_uri)
+
+    return add_abstract_node
+
+
+# Child triples, added to the current node
+
+
+def add_description(ctx, key, child, node_uri, parent_uri):
+    ctx.add(node_uri, ctx.ELI.description, Literal(child["content"]))
+    # get the number from the beginning of the string using regex
+    number = (
+        extract_all_numbers(child["content"][0:5])
+        if "content" in child and isinstance(child["content"], str)
+        else None
+    )
+
+    number = number if number else parse_node_id(key).number
+    ctx.add(node_uri, ctx.ELI.number, Literal(number))
+    for parent_title_alternative in list(ctx.title_alternatives.get(parent_uri, ())):
+        ctx.add_title_alternative(
+            node_uri, Literal(f"{parent_title_alternative}-{number}")
+        )
+
+
+def add_roman_title_id(ctx, key, child, node_uri, parent_uri):
+    number = extract_romans(child["content"])
+    ctx.add(node_uri, ctx.ELI.number, Literal(number))
+    ctx.add_title_alternative(node_uri, Literal(child["content"]))
+
+
+def add_title_id(ctx, key, child, node_uri, parent_uri):
+    number = extract_all_numbers(child["content"])
+    ctx.add(node_uri, ctx.ELI.number, Literal(number))
+    ctx.add_title_alternative(node_uri, Literal(child["content"]))
+
+
+def add_article_title_id(ctx, key, child, node_uri, parent_uri):
+    number = extract_all_numbers(child["content"])
+    ctx.add(node_uri, ctx.ELI.number, Literal(number))
+    ctx.add_title_alternative(node_uri, Literal(deep_extract_literal(child["content"])))
+
+
+def add_title(ctx, key, child, node_uri, parent_uri):
+    title = deep_extract_literal(child["content"])
+    ctx.add(node_uri, ctx.ELI.title, Literal(title))
+
+
+def add_title_description(ctx, key, child, node_uri, parent_uri):
+    title = deep_extract_literal(child["content"])
+    ctx.add(node_uri, ctx.ELI.description, Literal(title))
+
+
+# Rule tables, one per layer
+
+EU_RULES = {
+    "CHAPTER": Rule(
+        add_top_expression,
+        {
+            "ARTICLE": VISIT,
+            "SECTION": VISIT,
+            "TITLE_ID": add_roman_title_id,
+            "CHAPTER": add_roman_title_id,
+            "TITLE": add_title,
+        },
+        False,
+    ),
+    "SECTION": Rule(
+        add_expression,
+        {
+            "ARTICLE": VISIT,
+            "TITLE_ID": add_title_id,
+            "SECTION": add_title_id,
+            "TITLE": add_title_description,
+        },
+        True,
+    ),
+    "ARTICLE": Rule(
+        add_expression,
+        {
+            "POINT": VISIT,
+            "TITLE_ID": add_article_title_id,
+            "ARTICLE": add_article_title_id,
+            "TITLE": add_title_description,
+        },
+        True,
+    ),
+    "POINT": Rule(add_point, {"POINT": add_description, "SUBPOINT": VISIT}, True),
+    "SUBPOINT": Rule(add_subpoint, {}, True),
+}
+
+NATIONAL_RULES = {
+    "PART": Rule(add_top_expression, {"PART": add_title, "CHAPTER": VISIT}, False),
+    "CHAPTER": EU_RULES["CHAPTER"],
+    "SECTION": EU_RULES["SECTION"],
+    "ARTICLE": EU_RULES["ARTICLE"]._replace(emit=add_related_articles),
+    "POINT": EU_RULES["POINT"],
+    "SUBPOINT": Rule(
+        add_national_subpoint,
+        {"SUBPOINT": add_description, "SUBSUBPOINT": VISIT},
+        True,
+    ),
+    "SUBSUBPOINT": Rule(add_national_subsubpoint, {}, True),
+}
+
+EU_ABSTRACT_RULES = {
+    "CHAPTER": Rule(
+        abstract_node("Chapter"), {"ARTICLE": VISIT, "SECTION": VISIT}, False
+    ),
+    "SECTION": Rule(abstract_node("Section"), {"ARTICLE": VISIT}, True),
+    "ARTICLE": Rule(abstract_node("Article"), {"POINT": VISIT}, True),
+    "POINT": Rule(abstract_node("Point"), {"SUBPOINT": VISIT}, True),
+    "SUBPOINT": Rule(abstract_node("SubPoint"), {}, True),
+}
+
+# The national abstract ids carry an "_abstract_<locale>" suffix, which the
+# repeated-key check of the former recursive handlers never matched.
+NATIONAL_ABSTRACT_RULES = {
+    "PART": Rule(abstract_node("Part"), {"CHAPTER": VISIT}, False),
+    "CHAPTER": Rule(
+        abstract_node("Chapter"), {"ARTICLE": VISIT, "SECTION": VISIT}, False
+    ),
+    "SECTION": Rule(abstract_node("Section"), {"ARTICLE": VISIT}, False),
+    "ARTICLE": Rule(abstract_node("Article"), {"POINT": VISIT}, False),
+    "POINT": Rule(abstract_node("Point"), {"SUBPOINT": VISIT}, False),
+    "SUBPOINT": Rule(abstract_node("SubPoint"), {"SUBSUBPOINT": VISIT}, False),
+    "SUBSUBPOINT": Rule(abstract_node("SubSubPoint"), {}, False),
+}
+
+LAYERS = {
+    "eu": EU_RULES,
+    "eu_abstract": EU_ABSTRACT_RULES,
+    "national": NATIONAL_RULES,
+    "national_abstract": NATIONAL_ABSTRACT_RULES,
+}
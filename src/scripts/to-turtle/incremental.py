@@ -0,0 +1,122 @@
+import glob
+import hashlib
+import json
+import os
+import pickle
+
+BUILD_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def code_fingerprint() -> str:
+    """
+    Hash of the build code and configuration (main.py, handlers, locales.json,
+    eu_articles.json), so cached fragments are invalidated when the way
+    triples are produced changes.
+    """
+    digest = hashlib.sha256()
+    paths = sorted(
+        glob.glob(os.path.join(BUILD_DIR, "*.py"))
+        + glob.glob(os.path.join(BUILD_DIR, "*.json"))
+        + glob.glob(os.path.join(BUILD_DIR, "handlers", "*.py"))
+        + glob.glob(os.path.join(BUILD_DIR, "handlers", "*.json"))
+    )
+    for path in paths:
+        digest.update(os.path.relpath(path, BUILD_DIR).encode("utf-8"))
+        digest.update(file_hash(path).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def unit_key(unit_name: str, input_paths, fingerprint: str, config=None) -> str:
+    """
+    Key of a unit's fragment: the unit, the build code, the content of every
+    file it reads (its dataset, the EU article index) and the part of the
+    --config it uses, which may live outside the build directory.
+    """
+    digest = hashlib.sha256()
+    digest.update(unit_name.encode("utf-8"))
+    digest.update(fingerprint.encode("utf-8"))
+    for path in input_paths:
+        digest.update(file_hash(path).encode("utf-8"))
+    digest.update(json.dumps(config, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def fragment_path(cache_dir: str, unit_name: str) -> str:
+    return os.path.join(cache_dir, f"{unit_name}.pickle")
+
+
+def load_fragment(cache_dir: str, unit_name: str, key: str):
+    """Return the cached triples of a unit, or None if missing or stale."""
+    path = fragment_path(cache_dir, unit_name)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            fragment = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if fragment.get("key") != key:
+        return None
+    return fragment["triples"]
+
+
+def store_fragment(cache_dir: str, unit_name: str, key: str, triples):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = fragment_path(cache_dir, unit_name)
+    # Write to a temporary file first so an interrupted build never leaves
+    # a truncated fragment behind
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(
+            {"key": key, "triples": triples}, f, protocol=pickle.HIGHEST_PROTOCOL
+        )
+    os.replace(tmp_path, path)
+
+
+def outputs_key(unit_keys: dict, options) -> str:
+    """Key of the output files: every unit key plus the output options."""
+    digest = hashlib.sha256()
+    for name, key in unit_keys.items():
+        digest.update(f"{name}={key}\n".encode("utf-8"))
+    digest.update(json.dumps(options).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def outputs_manifest_path(cache_dir: str) -> str:
+    return os.path.join(cache_dir, "outputs.json")
+
+
+def outputs_up_to_date(cache_dir: str, key: str) -> bool:
+    """
+    True if the last build had the same key and none of the files it wrote
+    has been changed or removed since, so they can be reused as they are.
+    """
+    try:
+        with open(outputs_manifest_path(cache_dir), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if manifest.get("key") != key:
+        return False
+    for path, sha256 in manifest["files"].items():
+        if not os.path.exists(path) or file_hash(path) != sha256:
+            return False
+    return True
+
+
+def store_outputs(cache_dir: str, key: str, paths):
+    os.makedirs(cache_dir, exist_ok=True)
+    manifest = {"key": key, "files": {path: file_hash(path) for path in paths}}
+    path = outputs_manifest_path(cache_dir)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
@@ -1,26 +1,40 @@
+import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import rdflib
 from rdflib import URIRef, Literal, Namespace
 from rdflib.namespace import RDF, RDFS
 from file import make_path
-from handlers.handle_chapter import handle_chapter
-from handlers.handle_abstract_chapter import handle_abstract_chapter
-from handlers.handle_national_chapter import handle_national_chapter
-from handlers.handle_national_part import handle_national_part
-from handlers.handle_national_abstract_part import handle_national_abstract_part
-from handlers.handle_national_abstract_chapter import handle_national_abstract_chapter
-
+from sink import NTriplesSink, NQuadsSink
+from incremental import (
+    code_fingerprint,
+    unit_key,
+    load_fragment,
+    store_fragment,
+    outputs_key,
+    outputs_up_to_date,
+    store_outputs,
+)
+from stats import OntologyStats, stats_path, write_stats
+from split import LocaleSplitGraph, MANIFEST, write_locale_files
+from translations import Alignment, TranslationFilter, alignment_path, write_alignment
+# walker.py imports handlers/util.py as the top-level module util; importing
+# it again as handlers.util would load a second copy with its own caches
+from handlers.walker import EU_ARTICLES_PATH, WalkContext, walk
 
-# Create an RDF graph
-graph = rdflib.Graph()
 
 # Define namespaces
 GDPR = Namespace("http://example.org/gdpr#")
 RGDPR = Namespace("http://example.org/rgdpr#")
 ELI = Namespace("http://data.europa.eu/eli/ontology#")
-graph.bind("gdpr", GDPR)
-graph.bind("rgdpr", RGDPR)
-graph.bind("eli", ELI)
+
+CUSTOM_NAMESPACES = {
+    "RGDPR": RGDPR,
+    "GDPR": GDPR,
+    "ELI": ELI,
+}
 
 # Define classes (types)
 _GDPR = GDPR.GDPR
@@ -32,127 +46,122 @@ Point = GDPR.Point
 SubPoint = GDPR.SubPoint
 SubSubPoint = GDPR.SubSubPoint
 
-# Add type definitions (RDF:type)
-graph.add((Part, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((Chapter, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((Section, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((Article, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((Point, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((SubPoint, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((SubSubPoint, RDF.type, ELI.LegalResourceSubdivision))
-
-
-# Optionally add labels
-graph.add((_GDPR, RDFS.label, Literal("GDPR")))
-graph.add((Part, RDFS.label, Literal("Part")))
-graph.add((Chapter, RDFS.label, Literal("Chapter")))
-graph.add((Section, RDFS.label, Literal("Section")))
-graph.add((Article, RDFS.label, Literal("Article")))
-graph.add((Point, RDFS.label, Literal("Point")))
-graph.add((SubPoint, RDFS.label, Literal("SubPoint")))
-graph.add((SubSubPoint, RDFS.label, Literal("SubSubPoint")))
-
-# GENERAL STRUCTURE GDPR
-graph.add((_GDPR, RDF.type, ELI.LegalResource))
-graph.add((_GDPR, ELI.has_part, Chapter))
-graph.add((_GDPR, ELI.has_part, Part))
-
-graph.add((Part, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((Part, ELI.is_part_of, _GDPR))
-graph.add((Part, ELI.has_part, Chapter))
-
-graph.add((Chapter, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((Chapter, ELI.is_part_of, _GDPR))
-graph.add((Chapter, ELI.has_part, Section))
-graph.add((Chapter, ELI.has_part, Article))
-
-graph.add((Section, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((Section, ELI.is_part_of, Chapter))
-graph.add((Section, ELI.has_part, Article))
-
-graph.add((Article, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((Article, ELI.is_part_of, Chapter))
-graph.add((Article, ELI.is_part_of, Section))
-graph.add((Article, ELI.has_part, Point))
-
-graph.add((Point, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((Point, ELI.is_part_of, Article))
-graph.add((Point, ELI.has_part, SubPoint))
-
-graph.add((SubPoint, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((SubPoint, ELI.is_part_of, Point))
-graph.add((SubPoint, ELI.has_part, SubSubPoint))
-
-graph.add((SubSubPoint, RDF.type, ELI.LegalResourceSubdivision))
-graph.add((SubSubPoint, ELI.is_part_of, SubPoint))
-
-
-locales = [
-    "eu_en",
-    "eu_pt",
-    "eu_it",
-    "eu_de",
-]
+# Locales to build and the titles of their legal expressions.
+# Adding a member state only requires an entry here and its gdpr-<locale>.json
+DEFAULT_CONFIG = os.path.join(os.path.dirname(__file__), "locales.json")
+DEFAULT_DATASETS_DIR = "src/datasets"
+
+# Pairwise links between the EU locales, O(locales^2) triples per node
+TRANSLATION_PREDICATES = (ELI.has_translation, ELI.is_translation_of)
+
+
+def configure(config_path: str = DEFAULT_CONFIG, datasets_dir: str = None):
+    """Select the locale configuration and the directory the datasets are read from."""
+    global locale_config_path, datasets_root
+    global eu_titles, locales, national_titles, national_locales
+    locale_config_path = config_path
+    datasets_root = make_path(datasets_dir or DEFAULT_DATASETS_DIR)
+    with open(config_path, "r") as f:
+        locale_config = json.load(f)
+
+    # CONCRETE REALIZATION - USE OF rGDPR
+    eu_titles = locale_config["eu"]
+    locales = list(eu_titles)
+
+    # National Implementation
+    national_titles = locale_config["national"]
+    national_locales = list(national_titles)
+
+
+configure()
+
+
+def bind_namespaces(graph):
+    graph.bind("gdpr", GDPR)
+    graph.bind("rgdpr", RGDPR)
+    graph.bind("eli", ELI)
+
+
+def new_graph():
+    graph = rdflib.Graph()
+    bind_namespaces(graph)
+    return graph
+
+
+def dataset_path(file_name: str):
+    return os.path.join(datasets_root, file_name)
+
+
+def load_dataset(file_name: str):
+    with open(dataset_path(file_name), "r") as f:
+        return json.load(f)
+
+
+def add_schema(graph):
+    # Add type definitions (RDF:type)
+    graph.add((Part, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((Chapter, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((Section, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((Article, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((Point, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((SubPoint, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((SubSubPoint, RDF.type, ELI.LegalResourceSubdivision))
+
+    # Optionally add labels
+    graph.add((_GDPR, RDFS.label, Literal("GDPR")))
+    graph.add((Part, RDFS.label, Literal("Part")))
+    graph.add((Chapter, RDFS.label, Literal("Chapter")))
+    graph.add((Section, RDFS.label, Literal("Section")))
+    graph.add((Article, RDFS.label, Literal("Article")))
+    graph.add((Point, RDFS.label, Literal("Point")))
+    graph.add((SubPoint, RDFS.label, Literal("SubPoint")))
+    graph.add((SubSubPoint, RDFS.label, Literal("SubSubPoint")))
+
+    # GENERAL STRUCTURE GDPR
+    graph.add((_GDPR, RDF.type, ELI.LegalResource))
+    graph.add((_GDPR, ELI.has_part, Chapter))
+    graph.add((_GDPR, ELI.has_part, Part))
+
+    graph.add((Part, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((Part, ELI.is_part_of, _GDPR))
+    graph.add((Part, ELI.has_part, Chapter))
+
+    graph.add((Chapter, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((Chapter, ELI.is_part_of, _GDPR))
+    graph.add((Chapter, ELI.has_part, Section))
+    graph.add((Chapter, ELI.has_part, Article))
+
+    graph.add((Section, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((Section, ELI.is_part_of, Chapter))
+    graph.add((Section, ELI.has_part, Article))
+
+    graph.add((Article, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((Article, ELI.is_part_of, Chapter))
+    graph.add((Article, ELI.is_part_of, Section))
+    graph.add((Article, ELI.has_part, Point))
+
+    graph.add((Point, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((Point, ELI.is_part_of, Article))
+    graph.add((Point, ELI.has_part, SubPoint))
+
+    graph.add((SubPoint, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((SubPoint, ELI.is_part_of, Point))
+    graph.add((SubPoint, ELI.has_part, SubSubPoint))
+
+    graph.add((SubSubPoint, RDF.type, ELI.LegalResourceSubdivision))
+    graph.add((SubSubPoint, ELI.is_part_of, SubPoint))
+
 
 ## ONE LEVEL DOWN ##
-with open(make_path(f"src/datasets/gdpr-eu-en.json"), "r") as f:
-    data = json.load(f)
-    # Start the recursive function
+def add_eu_abstract(graph, data):
+    ctx = WalkContext(graph, "eu_abstract", CUSTOM_NAMESPACES, locales=locales)
     for key, node in data.items():
-        chapter_uri = URIRef(GDPR + key)
-        handle_abstract_chapter(
-            graph,
-            node,
-            chapter_uri,
-            locales,
-            {
-                "RGDPR": RGDPR,
-                "GDPR": GDPR,
-                "ELI": ELI,
-            },
-        )
-
-# CONCRETE REALIZATION - USE OF rGDPR
-graph.add(
-    (
-        URIRef(RGDPR + "gdpr_eu_en"),
-        ELI.title,
-        Literal(
-            "Regulation (EU) 2016/679 of the European Parliament and of the Council of 27 April 2016 on the protection of natural persons with regard to the processing of personal data and on the free movement of such data, and repealing Directive 95/46/EC (General Data Protection Regulation)"
-        ),
-    )
-)
-graph.add(
-    (
-        URIRef(RGDPR + "gdpr_eu_de"),
-        ELI.title,
-        Literal(
-            "VERORDNUNG (EU) 2016/679 DES EUROPÄISCHEN PARLAMENTS UND DES RATES vom 27. April 2016 zum Schutz natürlicher Personen bei der Verarbeitung personenbezogener Daten, zum freien Datenverkehr und zur Aufhebung der Richtlinie 95/46/EG (Datenschutz-Grundverordnung)"
-        ),
-    )
-)
-graph.add(
-    (
-        URIRef(RGDPR + "gdpr_eu_it"),
-        ELI.title,
-        Literal(
-            "REGOLAMENTO (UE) 2016/679 DEL PARLAMENTO EUROPEO E DEL CONSIGLIO del 27 aprile 2016 relativo alla protezione delle persone fisiche con riguardo al trattamento dei dati personali, nonché alla libera circolazione di tali dati e che abroga la direttiva 95/46/CE (regolamento generale sulla protezione dei dati)"
-        ),
-    )
-)
-graph.add(
-    (
-        URIRef(RGDPR + "gdpr_eu_pt"),
-        ELI.title,
-        Literal(
-            "REGULAMENTO (UE) 2016/679 DO PARLAMENTO EUROPEU E DO CONSELHO de 27 de abril de 2016 relativo à proteção das pessoas singulares no que diz respeito ao tratamento de dados pessoais e à livre circulação desses dados e que revoga a Diretiva 95/46/CE (Regulamento Geral sobre a Proteção de Dados)"
-        ),
-    )
-)
+        walk(ctx, key, node)
 
 
-for locale in locales:
+def add_eu_locale(graph, data, locale: str):
     rgdpr_uri = URIRef(RGDPR + f"gdpr_{locale}")
+    graph.add((rgdpr_uri, ELI.title, Literal(eu_titles[locale])))
     graph.add((rgdpr_uri, RDF.type, ELI.LegalExpression))
     graph.add((rgdpr_uri, ELI.realizes, _GDPR))
     graph.add((_GDPR, ELI.is_realized_by, rgdpr_uri))
@@ -174,94 +183,30 @@ for locale in locales:
             )
         )
 
-    json_file_locale = locale.replace("_", "-")
-    with open(make_path(f"src/datasets/gdpr-{json_file_locale}.json"), "r") as f:
-        data = json.load(f)
-
-    # Start the recursive function
+    ctx = WalkContext(graph, "eu", CUSTOM_NAMESPACES, locale, locales)
     for key, node in data.items():
-        chapter_uri = URIRef(RGDPR + key + "_" + locale)
-        other_locales = [l for l in locales if l != locale]
-        handle_chapter(
-            graph,
-            node,
-            chapter_uri,
-            locale,
-            other_locales,
-            {
-                "RGDPR": RGDPR,
-                "GDPR": GDPR,
-                "ELI": ELI,
-            },
-        )
+        walk(ctx, key, node)
 
-# National Implementation
-graph.add(
-    (
-        URIRef(RGDPR + "gdpr_de"),
-        ELI.title,
-        Literal(
-            "Gesetz zur Anpassung des Datenschutzrechts an die Verordnung (EU) 2016/679 und zur Umsetzung der Richtlinie (EU) 2016/680 (Datenschutz-Anpassungs- und -Umsetzungsgesetz EU – DSAnpUG-EU)"
-        ),
-    )
-)
-graph.add(
-    (
-        URIRef(RGDPR + "gdpr_pt"),
-        ELI.title,
-        Literal(
-            "Aprova as regras relativas ao tratamento de dados pessoais para efeitos de prevenção, deteção, investigação ou repressão de infrações penais ou de execução de sanções penais, transpondo a Diretiva (UE) 2016/680 do Parlamento Europeu e do Conselho, de 27 de abril de 2016"
-        ),
-    )
-)
 
-national_locales = ["de", "pt"]
 # National Abstract Implementation
-for locale in national_locales:
-    with open(make_path(f"src/datasets/gdpr-{locale}.json"), "r") as f:
-        data = json.load(f)
-        # Start the recursive function
-        for key, node in data.items():
-            node_uri = URIRef(GDPR + key + "_abstract_" + locale)
-            abstract_layer_uri = URIRef(GDPR + "gdpr_abstract_" + locale)
-            graph.add((abstract_layer_uri, RDF.type, ELI.LegalResource))
-            graph.add(
-                (abstract_layer_uri, RDFS.label, Literal(f"gdpr_abstract_{locale}"))
-            )
-            graph.add((abstract_layer_uri, ELI.has_part, node_uri))
-
-            if node["classType"] == "CHAPTER":
-
-                handle_national_abstract_chapter(
-                    graph,
-                    node,
-                    node_uri,
-                    None,
-                    locale,
-                    {
-                        "RGDPR": RGDPR,
-                        "GDPR": GDPR,
-                        "ELI": ELI,
-                    },
-                )
-            elif node["classType"] == "PART":
-                handle_national_abstract_part(
-                    graph,
-                    node,
-                    node_uri,
-                    locale,
-                    {
-                        "RGDPR": RGDPR,
-                        "GDPR": GDPR,
-                        "ELI": ELI,
-                    },
-                )
+def add_national_abstract(graph, data, locale: str):
+    ctx = WalkContext(graph, "national_abstract", CUSTOM_NAMESPACES, locale)
+    for key, node in data.items():
+        node_uri = ctx.node_uri(key)
+        abstract_layer_uri = URIRef(GDPR + "gdpr_abstract_" + locale)
+        graph.add((abstract_layer_uri, RDF.type, ELI.LegalResource))
+        graph.add((abstract_layer_uri, RDFS.label, Literal(f"gdpr_abstract_{locale}")))
+        graph.add((abstract_layer_uri, ELI.has_part, node_uri))
+
+        if node["classType"] in ("CHAPTER", "PART"):
+            walk(ctx, key, node)
 
-# National Concrete Implementation
 
-for locale in national_locales:
+# National Concrete Implementation
+def add_national_concrete(graph, data, locale: str):
     abstract_layer_uri = URIRef(GDPR + "gdpr_abstract_" + locale)
     rgdpr_uri = URIRef(RGDPR + f"gdpr_{locale}")
+    graph.add((rgdpr_uri, ELI.title, Literal(national_titles[locale])))
     graph.add((rgdpr_uri, RDF.type, ELI.LegalExpression))
     graph.add((rgdpr_uri, ELI.language, Literal(locale)))
     graph.add((rgdpr_uri, ELI.realizes, abstract_layer_uri))
@@ -282,41 +227,304 @@ for locale in national_locales:
 
     graph.add((abstract_layer_uri, ELI.is_realized_by, rgdpr_uri))
 
-    with open(make_path(f"src/datasets/gdpr-{locale}.json"), "r") as f:
-        data = json.load(f)
-        for key, node in data.items():
-            node_uri = URIRef(RGDPR + key + "_" + locale)
-
-            if node["classType"] == "CHAPTER":
-                handle_national_chapter(
-                    graph,
-                    node,
-                    node_uri,
-                    None,
-                    locale,
-                    {
-                        "RGDPR": RGDPR,
-                        "GDPR": GDPR,
-                        "ELI": ELI,
-                    },
-                )
-            elif node["classType"] == "PART":
-                handle_national_part(
-                    graph,
-                    node,
-                    node_uri,
-                    locale,
-                    {
-                        "RGDPR": RGDPR,
-                        "GDPR": GDPR,
-                        "ELI": ELI,
-                    },
-                )
-
-
-# Serialize the RDF graph in Turtle format
-graph.serialize(
-    format="turtle",
-    encoding="utf-8",
-    destination=make_path("src/datasets/rdfs/abstract.ttl"),
-)
+    ctx = WalkContext(graph, "national", CUSTOM_NAMESPACES, locale)
+    for key, node in data.items():
+        if node["classType"] in ("CHAPTER", "PART"):
+            walk(ctx, key, node)
+
+
+def build_units():
+    """
+    List the independent units of work of the build, in output order.
+
+    Each unit is a (name, dataset file, function) tuple; the function only reads
+    back triples it added itself, so units can be built in separate processes.
+    """
+    units = [("schema", None, add_schema)]
+    units.append(("eu_abstract", "gdpr-eu-en.json", add_eu_abstract))
+    for locale in locales:
+        units.append(
+            (
+                locale,
+                f"gdpr-{locale.replace('_', '-')}.json",
+                lambda g, d, locale=locale: add_eu_locale(g, d, locale),
+            )
+        )
+    for locale in national_locales:
+        units.append(
+            (
+                f"abstract_{locale}",
+                f"gdpr-{locale}.json",
+                lambda g, d, locale=locale: add_national_abstract(g, d, locale),
+            )
+        )
+    for locale in national_locales:
+        units.append(
+            (
+                locale,
+                f"gdpr-{locale}.json",
+                lambda g, d, locale=locale: add_national_concrete(g, d, locale),
+            )
+        )
+    return units
+
+
+def run_unit(graph, unit):
+    name, file_name, fn = unit
+    if file_name is None:
+        fn(graph)
+    else:
+        fn(graph, load_dataset(file_name))
+
+
+class RecordingGraph(rdflib.Graph):
+    """Graph that remembers the order in which new triples were added."""
+
+    def __init__(self):
+        super().__init__()
+        self.added = []
+
+    def add(self, triple):
+        if triple not in self:
+            self.added.append(triple)
+        return super().add(triple)
+
+
+def build_unit_triples(unit_name: str):
+    """Worker entry point: build a single unit and return its triples in order."""
+    unit = next(u for u in build_units() if u[0] == unit_name)
+    partial = RecordingGraph()
+    run_unit(partial, unit)
+    return partial.added
+
+
+def begin_unit(graph, name: str):
+    # Streaming sinks need to know which unit the following triples belong to
+    if hasattr(graph, "begin_unit"):
+        graph.begin_unit(name)
+
+
+def worker_pool(workers=None):
+    # Workers may not inherit the module state (spawn), so configure them explicitly
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=configure,
+        initargs=(locale_config_path, datasets_root),
+    )
+
+
+def build_sequential(graph):
+    for unit in build_units():
+        begin_unit(graph, unit[0])
+        run_unit(graph, unit)
+
+
+def build_parallel(graph, workers=None):
+    names = [name for name, _, _ in build_units()]
+    with worker_pool(workers) as executor:
+        # Merge in unit order so the graph matches the sequential build
+        for name, triples in zip(names, executor.map(build_unit_triples, names)):
+            begin_unit(graph, name)
+            for triple in triples:
+                graph.add(triple)
+
+
+def unit_inputs(name: str, file_name: str):
+    """
+    What a build unit reads besides the build code: its input files and the
+    part of the locale configuration it uses. Every EU layer links all EU
+    locales, so adding a locale rebuilds them but not the national layers.
+    """
+    paths = [dataset_path(file_name)] if file_name else []
+    if name == "eu_abstract":
+        return paths, {"locales": locales}
+    if name in eu_titles:
+        return paths, {"locales": locales, "title": eu_titles[name]}
+    if name in national_titles:
+        # relatedArticles are resolved against the EU article index
+        return paths + [EU_ARTICLES_PATH], {"title": national_titles[name]}
+    return paths, None
+
+
+def unit_keys():
+    """Cache key of every build unit, in unit order."""
+    fingerprint = code_fingerprint()
+    keys = {}
+    for name, file_name, _ in build_units():
+        paths, config = unit_inputs(name, file_name)
+        keys[name] = unit_key(name, paths, fingerprint, config)
+    return keys
+
+
+def build_incremental(graph, cache_dir, parallel=False, workers=None):
+    """
+    Rebuild only the units whose dataset (or the build code) changed since the
+    last run, and reassemble the output from the cached fragments.
+    Returns the names of the units that had to be rebuilt.
+    """
+    keys = unit_keys()
+    fragments = {name: load_fragment(cache_dir, name, key) for name, key in keys.items()}
+
+    stale = [name for name, triples in fragments.items() if triples is None]
+    if parallel and len(stale) > 1:
+        with worker_pool(workers) as executor:
+            rebuilt = executor.map(build_unit_triples, stale)
+            for name, triples in zip(stale, rebuilt):
+                fragments[name] = triples
+    else:
+        for name in stale:
+            fragments[name] = build_unit_triples(name)
+
+    for name in stale:
+        store_fragment(cache_dir, name, keys[name], fragments[name])
+
+    for name, triples in fragments.items():
+        begin_unit(graph, name)
+        for triple in triples:
+            graph.add(triple)
+    return stale
+
+
+def build(graph, parallel=False, workers=None, cache_dir=None):
+    if cache_dir:
+        stale = build_incremental(graph, cache_dir, parallel, workers)
+        print(f"Rebuilt {len(stale)} unit(s): {', '.join(stale) or 'none'}")
+    elif parallel:
+        build_parallel(graph, workers)
+    else:
+        build_sequential(graph)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the GDPR ontology")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="build each locale in its own worker process",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["turtle", "nt", "nquads"],
+        default="turtle",
+        help="nt/nquads stream triples to disk instead of building an in-memory graph",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only rebuild datasets whose content changed since the last run and "
+        "reuse the previous output files if none did. A changed dataset still "
+        "re-serializes the whole graph, which only --format nt/nquads does fast",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="where --incremental keeps the per-dataset triple fragments "
+        "(default: <output-dir>/.build-cache)",
+    )
+    parser.add_argument(
+        "--config",
+        default=DEFAULT_CONFIG,
+        help="locale configuration (EU locales and national implementations)",
+    )
+    parser.add_argument(
+        "--datasets-dir",
+        default=DEFAULT_DATASETS_DIR,
+        help="directory with the gdpr-*.json datasets",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="src/datasets/rdfs",
+        help="directory abstract.ttl/.nt/.nq and the abstract.stats.json and "
+        "abstract.alignment.json sidecars are written to",
+    )
+    parser.add_argument(
+        "--split",
+        action="store_true",
+        help="also write one Turtle file per locale to <output-dir>/locales "
+        "for the dashboard to load lazily",
+    )
+    parser.add_argument(
+        "--omit-translations",
+        action="store_true",
+        help="leave out the pairwise eli:has_translation/eli:is_translation_of "
+        "triples; the dashboard derives them from abstract.alignment.json",
+    )
+    args = parser.parse_args()
+    if args.split and args.format != "turtle":
+        parser.error("--split requires --format turtle")
+    configure(args.config, args.datasets_dir)
+    output_dir = make_path(args.output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    cache_dir = None
+    if args.incremental:
+        cache_dir = make_path(
+            args.cache_dir or os.path.join(output_dir, ".build-cache")
+        )
+        output_key = outputs_key(
+            unit_keys(),
+            [args.format, args.split, args.omit_translations, output_dir],
+        )
+        if outputs_up_to_date(cache_dir, output_key):
+            print("Rebuilt 0 unit(s): none, the output files are up to date")
+            return
+    alignment = Alignment(GDPR, RGDPR, ELI.realizes, locales)
+
+    def translation_filter(graph):
+        # Records the alignment table and, if asked, drops the translations
+        return TranslationFilter(
+            graph, alignment, TRANSLATION_PREDICATES, args.omit_translations
+        )
+
+    # Files written, for --incremental to check they are still up to date
+    written = []
+    if args.format != "turtle":
+        extension = "nt" if args.format == "nt" else "nq"
+        destination = os.path.join(output_dir, f"abstract.{extension}")
+        stats = OntologyStats()
+        with open(destination, "w", encoding="utf-8") as out:
+            if args.format == "nt":
+                sink = NTriplesSink(out, stats)
+            else:
+                # One named graph per build unit (i.e. per locale)
+                sink = NQuadsSink(out, RGDPR, stats)
+            build(translation_filter(sink), args.parallel, args.workers, cache_dir)
+    else:
+        # Create an RDF graph
+        graph = new_graph()
+        if args.split:
+            # Also keeps the triples of every locale in a graph of their own
+            split = LocaleSplitGraph(graph, new_graph)
+            build(translation_filter(split), args.parallel, args.workers, cache_dir)
+            manifest = write_locale_files(split, output_dir, eu_titles, national_titles)
+            locales_dir = os.path.join(output_dir, "locales")
+            written.append(os.path.join(locales_dir, MANIFEST))
+            written.append(os.path.join(locales_dir, manifest["core"]))
+            for entry in manifest["locales"].values():
+                written.append(os.path.join(locales_dir, entry["file"]))
+        else:
+            build(translation_filter(graph), args.parallel, args.workers, cache_dir)
+
+        # Serialize the RDF graph in Turtle format
+        destination = os.path.join(output_dir, "abstract.ttl")
+        graph.serialize(format="turtle", encoding="utf-8", destination=destination)
+
+        # Sidecar statistics for the dashboard Overview page
+        stats = OntologyStats()
+        for triple in graph:
+            stats.add(triple)
+
+    write_stats(stats, destination)
+    write_alignment(alignment, destination)
+    if cache_dir:
+        written += [destination, stats_path(destination), alignment_path(destination)]
+        store_outputs(cache_dir, output_key, written)
+
+
+if __name__ == "__main__":
+    main()
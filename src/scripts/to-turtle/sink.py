@@ -0,0 +1,78 @@
+import hashlib
+from rdflib import URIRef, Literal, BNode
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def nt_term(term) -> str:
+    """Format a term the way N-Triples expects it (always on a single line)."""
+    if isinstance(term, URIRef):
+        return f"<{term}>"
+    if isinstance(term, BNode):
+        return f"_:{term}"
+    if isinstance(term, Literal):
+        literal = f'"{_escape(str(term))}"'
+        if term.language:
+            return f"{literal}@{term.language}"
+        if term.datatype:
+            return f"{literal}^^<{term.datatype}>"
+        return literal
+    raise TypeError(f"Cannot serialize {term!r} as N-Triples")
+
+
+class NTriplesSink:
+    """
+    Write triples straight to an N-Triples stream instead of keeping them in a Graph.
+
+    Implements the small part of the rdflib.Graph interface used by the build:
+    ``add``. Duplicates are dropped using a digest of each line. Every written
+    triple is also passed to ``stats`` (an OntologyStats) when one is given.
+    """
+
+    def __init__(self, out, stats=None):
+        self.out = out
+        self.stats = stats
+        self.count = 0
+        self._seen = set()
+
+    def format_row(self, triple) -> str:
+        s, p, o = triple
+        return f"{nt_term(s)} {nt_term(p)} {nt_term(o)} .\n"
+
+    def add(self, triple):
+        row = self.format_row(triple)
+        digest = hashlib.blake2b(row.encode("utf-8"), digest_size=16).digest()
+        if digest in self._seen:
+            return self
+        self._seen.add(digest)
+        self.out.write(row)
+        self.count += 1
+        if self.stats is not None:
+            self.stats.add(triple)
+        return self
+
+    def __len__(self):
+        return self.count
+
+
+class NQuadsSink(NTriplesSink):
+    """N-Quads variant of NTriplesSink writing each build unit to its own named graph."""
+
+    def __init__(self, out, graph_namespace, stats=None):
+        super().__init__(out, stats)
+        self.graph_namespace = graph_namespace
+        self.graph_name = None
+
+    def begin_unit(self, name: str):
+        self.graph_name = URIRef(self.graph_namespace + f"graph_{name}")
+
+    def format_row(self, triple) -> str:
+        s, p, o = triple
+        return f"{nt_term(s)} {nt_term(p)} {nt_term(o)} {nt_term(self.graph_name)} .\n"
@@ -0,0 +1,81 @@
+import json
+import os
+
+CORE = "core"
+MANIFEST = "index.json"
+
+
+def unit_group(unit_name: str) -> str:
+    """
+    Locale file a build unit belongs to: the schema and the EU abstract layer go
+    to the core file, a national abstract layer goes with its member state.
+    """
+    if unit_name in ("schema", "eu_abstract"):
+        return CORE
+    if unit_name.startswith("abstract_"):
+        return unit_name[len("abstract_") :]
+    return unit_name
+
+
+class LocaleSplitGraph:
+    """
+    Forwards the build to ``graph`` while also copying every triple into a
+    separate graph per locale group (see unit_group), so each locale can be
+    written to its own file and loaded on its own.
+
+    Implements the small part of the rdflib.Graph interface used by the build:
+    ``add`` and ``begin_unit``.
+    """
+
+    def __init__(self, graph, new_graph):
+        self.graph = graph
+        self.new_graph = new_graph
+        self.groups = {}
+        self._current = None
+
+    def begin_unit(self, name: str):
+        if hasattr(self.graph, "begin_unit"):
+            self.graph.begin_unit(name)
+        group = unit_group(name)
+        if group not in self.groups:
+            self.groups[group] = self.new_graph()
+        self._current = self.groups[group]
+
+    def add(self, triple):
+        self.graph.add(triple)
+        self._current.add(triple)
+        return self
+
+    def __len__(self):
+        return len(self.graph)
+
+
+def write_locale_files(
+    split: LocaleSplitGraph, output_dir: str, eu_titles: dict, national_titles: dict
+):
+    """
+    Write <output_dir>/locales/<group>.ttl for every locale group, and an
+    index.json manifest listing the core file and the file of each locale.
+    """
+    locales_dir = os.path.join(output_dir, "locales")
+    os.makedirs(locales_dir, exist_ok=True)
+    manifest = {"core": None, "locales": {}}
+    for group, graph in split.groups.items():
+        file_name = f"{group}.ttl"
+        graph.serialize(
+            format="turtle",
+            encoding="utf-8",
+            destination=os.path.join(locales_dir, file_name),
+        )
+        if group == CORE:
+            manifest["core"] = file_name
+            continue
+        manifest["locales"][group] = {
+            "file": file_name,
+            "layer": "eu" if group in eu_titles else "national",
+            "title": eu_titles.get(group) or national_titles.get(group),
+            "triples": len(graph),
+        }
+    with open(os.path.join(locales_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
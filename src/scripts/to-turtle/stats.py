@@ -0,0 +1,70 @@
+import json
+import os
+from collections import Counter
+
+from rdflib.namespace import RDF
+
+from incremental import file_hash
+
+SAMPLE_TRIPLES = slice(2, 5)
+
+
+def local_name(term) -> str:
+    return str(term).split("#")[-1]
+
+
+class OntologyStats:
+    """
+    Statistics shown on the dashboard Overview page, accumulated triple by
+    triple so they can be collected from a Graph or from a streaming sink.
+    """
+
+    def __init__(self):
+        self.triples = 0
+        self.typed_subjects = set()
+        self.predicates = set()
+        self.entities = set()
+        self.class_counts = Counter()
+        self.property_counts = Counter()
+        self.first_triples = []
+
+    def add(self, triple):
+        s, p, o = triple
+        self.triples += 1
+        self.predicates.add(p)
+        self.entities.add(s)
+        self.entities.add(o)
+        self.property_counts[local_name(p)] += 1
+        if p == RDF.type:
+            self.typed_subjects.add(s)
+            self.class_counts[local_name(o)] += 1
+        if len(self.first_triples) < SAMPLE_TRIPLES.stop:
+            self.first_triples.append(triple)
+
+    def to_dict(self, ontology_sha256: str) -> dict:
+        return {
+            "ontology_sha256": ontology_sha256,
+            "triples": self.triples,
+            "typed_subjects": len(self.typed_subjects),
+            "predicates": len(self.predicates),
+            "entities": len(self.entities),
+            "class_counts": dict(self.class_counts.most_common()),
+            "property_counts": dict(self.property_counts.most_common()),
+            "sample_triples": [
+                [str(term) for term in triple]
+                for triple in self.first_triples[SAMPLE_TRIPLES]
+            ],
+        }
+
+
+def stats_path(ontology_path: str) -> str:
+    """abstract.ttl -> abstract.stats.json"""
+    return os.path.splitext(ontology_path)[0] + ".stats.json"
+
+
+def write_stats(stats: OntologyStats, ontology_path: str):
+    """Write the sidecar JSON of an ontology file, bound to its content hash."""
+    with open(stats_path(ontology_path), "w", encoding="utf-8") as f:
+        json.dump(
+            stats.to_dict(file_hash(ontology_path)), f, ensure_ascii=False, indent=2
+        )
@@ -0,0 +1,95 @@
+import json
+import os
+
+from incremental import file_hash
+
+
+class Alignment:
+    """
+    Alignment table of the EU locales: abstract node id -> {locale: concrete
+    node id}, e.g. "cpt_1.art_1" -> {"eu_en": "cpt_1.art_1_eu_en", ...} and
+    "GDPR" -> {"eu_en": "gdpr_eu_en", ...} for the whole regulation.
+
+    Accumulated triple by triple from the eli:realizes links of the concrete
+    nodes of the given locales, like OntologyStats, so it can be collected from
+    any build mode. The national layers realize their own abstract layer and
+    are not aligned.
+    """
+
+    def __init__(self, abstract_ns, concrete_ns, realizes, locales):
+        self.abstract_ns = str(abstract_ns)
+        self.concrete_ns = str(concrete_ns)
+        self.realizes = realizes
+        self.suffixes = {"_" + locale: locale for locale in locales}
+        self.locales = list(locales)
+        self.nodes = {}
+
+    def locale_of(self, concrete_id: str):
+        for suffix, locale in self.suffixes.items():
+            if concrete_id.endswith(suffix):
+                return locale
+        return None
+
+    def add(self, triple):
+        s, p, o = triple
+        if p != self.realizes:
+            return
+        s, o = str(s), str(o)
+        if not (s.startswith(self.concrete_ns) and o.startswith(self.abstract_ns)):
+            return
+        concrete_id = s[len(self.concrete_ns) :]
+        locale = self.locale_of(concrete_id)
+        if locale is not None:
+            key = o[len(self.abstract_ns) :]
+            self.nodes.setdefault(key, {})[locale] = concrete_id
+
+    def to_dict(self, ontology_sha256: str) -> dict:
+        return {
+            "ontology_sha256": ontology_sha256,
+            "abstract_namespace": self.abstract_ns,
+            "concrete_namespace": self.concrete_ns,
+            "locales": self.locales,
+            "nodes": self.nodes,
+        }
+
+
+class TranslationFilter:
+    """
+    Forwards the build to ``graph``, passing every triple to ``alignment`` on
+    the way and, with ``omit``, dropping the ``translation_predicates`` triples
+    (eli:has_translation / eli:is_translation_of between every pair of EU
+    locales). They can be derived from the alignment table instead.
+
+    Implements the small part of the rdflib.Graph interface used by the build:
+    ``add`` and ``begin_unit``.
+    """
+
+    def __init__(self, graph, alignment, translation_predicates, omit=False):
+        self.graph = graph
+        self.alignment = alignment
+        self.omitted = set(translation_predicates) if omit else set()
+
+    def begin_unit(self, name: str):
+        if hasattr(self.graph, "begin_unit"):
+            self.graph.begin_unit(name)
+
+    def add(self, triple):
+        if triple[1] in self.omitted:
+            return self
+        self.alignment.add(triple)
+        self.graph.add(triple)
+        return self
+
+    def __len__(self):
+        return len(self.graph)
+
+
+def alignment_path(ontology_path: str) -> str:
+    """abstract.ttl -> abstract.alignment.json"""
+    return os.path.splitext(ontology_path)[0] + ".alignment.json"
+
+
+def write_alignment(alignment: Alignment, ontology_path: str):
+    """Write the alignment table of an ontology file, bound to its content hash."""
+    with open(alignment_path(ontology_path), "w", encoding="utf-8") as f:
+        json.dump(alignment.to_dict(file_hash(ontology_path)), f, ensure_ascii=False)